@@ -4,246 +4,466 @@
 - PDF/첨부파일 URL 자동 추출
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import hashlib
+import re
+from contextlib import AsyncExitStack
+import aiofiles
+import aiohttp
+import lxml.html
+from lxml import etree
 from urllib.parse import urljoin, urlparse
 import time
-import json
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
-from config import CRAWL_CONFIG, OFFICIAL_SOURCES, SEOUL_DISTRICTS, RAW_DIR
+# 패키지(agents.*)로 임포트되면 프로젝트 루트가 이미 sys.path에 있으므로
+# 스크립트로 직접 실행할 때만 루트 경로 추가
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config import CRAWL_CONFIG, OFFICIAL_SOURCES, SEOUL_DISTRICTS, RAW_DIR, OUTPUT_CONFIG
+from jsonio import load_json, dump_json, dump_artifact
 
 logger = logging.getLogger(__name__)
 
+# 25개 자치구 이름을 한 번의 스캔으로 찾는 다중 패턴 매처
+_DISTRICT_PATTERN = re.compile("|".join(map(re.escape, SEOUL_DISTRICTS)))
+_DISTRICT_ORDER = {district: i for i, district in enumerate(SEOUL_DISTRICTS)}
+
+# 첨부파일 확장자 (href 어디에든 포함되면 첨부파일로 판단)
+_ATTACHMENT_PATTERN = re.compile(r"\.(pdf|hwpx|hwp|docx|xlsx)", re.IGNORECASE)
+
+# 본문 영역 후보 - 모듈 로드 시 한 번만 컴파일 (div.view-con, div.content, article, .post-content, .board-view, .bbs-view, main)
+_CONTENT_AREAS = etree.XPath("|".join([
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' view-con ')]",
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' content ')]",
+    "//article",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' board-view ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' bbs-view ')]",
+    "//main",
+]))
+
+# 링크 수집용 XPath (모듈 로드 시 한 번만 컴파일)
+_ANCHORS = etree.XPath("//a[@href]")
+
+
+def _element_text(element: lxml.html.HtmlElement, separator: str = "") -> str:
+    """요소의 텍스트 조각을 앞뒤 공백 제거 후 separator로 연결"""
+    return separator.join(piece for piece in map(str.strip, element.itertext()) if piece)
+
 
 class DistrictCrawler:
     """자치구 셔틀버스 공지 크롤러"""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.headers = {
             "User-Agent": CRAWL_CONFIG["user_agent"],
             "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8"
-        })
+        }
+        # run() 실행 중에만 생성되는 비동기 세션 / 동시 요청 제한
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.download_semaphore: Optional[asyncio.Semaphore] = None
+        # 조건부 요청용 HTTP 캐시 (URL → ETag / Last-Modified / sha256)
+        self.cache_enabled = CRAWL_CONFIG["cache_enabled"]
+        self.cache_file = CRAWL_CONFIG["cache_file"]
+        self.cache_dir = CRAWL_CONFIG["cache_dir"]
+        self.http_cache = self.load_http_cache()
+
         self.collected_data = []
         self.keywords = ["무료", "셔틀", "파업", "비상", "수송", "노선", "운행"]
 
-    def fetch_page(self, url: str) -> Optional[str]:
-        """웹 페이지 HTML 가져오기"""
+    def load_http_cache(self) -> Dict:
+        """HTTP 캐시 로드"""
+        if self.cache_enabled and self.cache_file.exists():
+            try:
+                return load_json(self.cache_file)
+            except Exception as e:
+                logger.warning(f"HTTP 캐시 로드 실패: {e}")
+        return {}
+
+    def save_http_cache(self):
+        """HTTP 캐시 저장"""
+        if self.cache_enabled:
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                dump_json(self.http_cache, self.cache_file, indent=False)
+            except Exception as e:
+                logger.warning(f"HTTP 캐시 저장 실패: {e}")
+
+    def _remember(self, url: str, headers, digest: str, path: Optional[Path] = None):
+        """응답 검증자(ETag / Last-Modified)를 캐시에 기록"""
+        if not self.cache_enabled:
+            return
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        if etag or last_modified:
+            self.http_cache[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "sha256": digest,
+                "path": str(path) if path else None
+            }
+        else:
+            self.http_cache.pop(url, None)
+
+    async def fetch_page(self, url: str) -> Optional[lxml.html.HtmlElement]:
+        """웹 페이지를 받아 파싱된 문서 반환 (변경 없으면 캐시 본문 사용)
+
+        본문은 청크 단위로 받는 즉시 파서에 넣으므로 HTML 전체를 문자열로 만들지 않음
+        """
+        timeout = aiohttp.ClientTimeout(total=CRAWL_CONFIG["timeout"])
+
+        # 캐시된 본문이 있으면 조건부 요청
+        cached = self.http_cache.get(url)
+        body_path = self.cache_dir / f"{cached['sha256']}.html" if cached else None
+        headers = {}
+        if body_path and body_path.exists():
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
         for attempt in range(CRAWL_CONFIG["retry_count"]):
             try:
-                response = self.session.get(
-                    url,
-                    timeout=CRAWL_CONFIG["timeout"]
-                )
-                response.encoding = "utf-8"
+                async with self.session.get(url, timeout=timeout, headers=headers) as response:
+                    if response.status == 304 and headers:
+                        return await self._parse_file(body_path)
 
-                if response.status_code == 200:
-                    return response.text
+                    if response.status == 200:
+                        return await self._parse_response(url, response)
 
-                logger.warning(f"HTTP {response.status_code}: {url}")
+                    logger.warning(f"HTTP {response.status}: {url}")
 
-            except requests.RequestException as e:
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 logger.warning(f"요청 실패 (시도 {attempt + 1}): {e}")
-                time.sleep(CRAWL_CONFIG["retry_delay"])
+                await asyncio.sleep(CRAWL_CONFIG["retry_delay"])
 
         return None
 
-    def extract_district_links(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    async def _parse_response(self, url: str, response: aiohttp.ClientResponse) -> Optional[lxml.html.HtmlElement]:
+        """응답 본문을 스트리밍으로 파싱하면서 해시 계산 / 내용 해시 경로에 저장"""
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+        digest = hashlib.sha256()
+
+        # 검증자가 있는 응답만 캐시 (본문은 임시 파일에 바로 기록)
+        store = self.cache_enabled and bool(
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        )
+        part_path = self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.part"
+
+        async with AsyncExitStack() as stack:
+            f = None
+            if store:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                f = await stack.enter_async_context(aiofiles.open(part_path, "wb"))
+
+            async for chunk in response.content.iter_chunked(CRAWL_CONFIG["chunk_size"]):
+                parser.feed(chunk)
+                digest.update(chunk)
+                if f:
+                    await f.write(chunk)
+
+        digest = digest.hexdigest()
+        self._remember(url, response.headers, digest)
+
+        if store:
+            part_path.replace(self.cache_dir / f"{digest}.html")
+
+        return self._close_parser(parser)
+
+    async def _parse_file(self, path: Path) -> Optional[lxml.html.HtmlElement]:
+        """캐시된 본문을 청크 단위로 읽어 파싱"""
+        parser = lxml.html.HTMLParser(encoding="utf-8")
+
+        async with aiofiles.open(path, "rb") as f:
+            while chunk := await f.read(CRAWL_CONFIG["chunk_size"]):
+                parser.feed(chunk)
+
+        return self._close_parser(parser)
+
+    @staticmethod
+    def _close_parser(parser: lxml.html.HTMLParser) -> Optional[lxml.html.HtmlElement]:
+        """피드 파서를 닫고 문서 루트 반환 (빈 문서면 None)"""
+        try:
+            return parser.close()
+        except etree.XMLSyntaxError:
+            return None
+
+    def _harvest(self, tree: lxml.html.HtmlElement) -> List[Tuple[str, str]]:
+        """스크립트/스타일을 제거하고 링크의 (href, 텍스트) 목록 반환"""
+        # 본문 텍스트에 섞이지 않도록 스크립트/스타일 제거
+        etree.strip_elements(tree, "script", "style", "template", with_tail=False)
+
+        # 링크 텍스트는 여기서 한 번만 계산해 링크/첨부파일 추출이 공유
+        return [(a_tag.get("href", ""), _element_text(a_tag)) for a_tag in _ANCHORS(tree)]
+
+    def _extract_all(self, tree: lxml.html.HtmlElement, base_url: str, with_links: bool = True) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+        """파싱된 문서 하나에서 (자치구 링크, 첨부파일, 노선 정보) 추출
+
+        with_links=False면 자치구 링크 추출을 건너뜀 (자치구 개별 페이지용)
+        """
+        anchors = self._harvest(tree)
+
+        district_links = self.extract_district_links(anchors, base_url) if with_links else []
+        attachments = self.extract_attachments(anchors, base_url)
+        routes = self.extract_route_info(tree, base_url)
+
+        return district_links, attachments, routes
+
+    def extract_district_links(self, anchors: List[Tuple[str, str]], base_url: str) -> List[Dict]:
         """자치구 관련 링크 추출"""
         links = []
 
-        for a_tag in soup.find_all("a", href=True):
-            href = a_tag.get("href", "")
-            text = a_tag.get_text(strip=True)
-
-            # 자치구 이름 확인
-            for district in SEOUL_DISTRICTS.keys():
-                if district in text:
-                    full_url = urljoin(base_url, href)
-                    links.append({
-                        "district": district,
-                        "text": text,
-                        "url": full_url,
-                        "type": "district_link"
-                    })
-                    break
+        for href, text in anchors:
+            # 자치구 이름 확인 (여러 개면 설정 순서상 앞선 구)
+            matches = set(_DISTRICT_PATTERN.findall(text))
+            if matches:
+                district = min(matches, key=_DISTRICT_ORDER.__getitem__)
+                links.append({
+                    "district": district,
+                    "text": text,
+                    "url": urljoin(base_url, href),
+                    "type": "district_link"
+                })
 
         return links
 
-    def extract_attachments(self, soup: BeautifulSoup, base_url: str) -> List[Dict]:
+    def extract_attachments(self, anchors: List[Tuple[str, str]], base_url: str) -> List[Dict]:
         """첨부파일 (PDF, HWP 등) URL 추출"""
         attachments = []
-        file_extensions = [".pdf", ".hwp", ".hwpx", ".docx", ".xlsx"]
-
-        for a_tag in soup.find_all("a", href=True):
-            href = a_tag.get("href", "").lower()
 
-            for ext in file_extensions:
-                if ext in href:
-                    full_url = urljoin(base_url, a_tag.get("href"))
-                    filename = a_tag.get_text(strip=True) or urlparse(href).path.split("/")[-1]
+        for href, text in anchors:
+            match = _ATTACHMENT_PATTERN.search(href)
+            if match:
+                filename = text or urlparse(href.lower()).path.split("/")[-1]
 
-                    attachments.append({
-                        "filename": filename,
-                        "url": full_url,
-                        "type": ext.replace(".", ""),
-                        "source": base_url
-                    })
-                    break
+                attachments.append({
+                    "filename": filename,
+                    "url": urljoin(base_url, href),
+                    "type": match.group(1).lower(),
+                    "source": base_url
+                })
 
         return attachments
 
-    def extract_route_info(self, soup: BeautifulSoup, source_url: str) -> List[Dict]:
+    def extract_route_info(self, tree: Optional[lxml.html.HtmlElement], source_url: str) -> List[Dict]:
         """페이지 본문에서 노선 정보 추출"""
         routes = []
 
+        if tree is None:
+            return routes
+
         # 본문 영역 선택
-        content_areas = soup.select(
-            "div.view-con, div.content, article, .post-content, "
-            ".board-view, .bbs-view, main"
-        )
+        content_areas = _CONTENT_AREAS(tree)
 
         if not content_areas:
-            content_areas = [soup.body] if soup.body else []
+            body = tree.find("body")
+            content_areas = [body] if body is not None else []
 
         for section in content_areas:
-            text = section.get_text("\n", strip=True)
+            text = _element_text(section, "\n")
+
+            # 본문 전체를 한 번 스캔해 자치구가 언급된 줄 수집
+            mentions = self._district_mentions(text)
+            first_line = {}
+            for index, (_, _, districts) in enumerate(mentions):
+                for district in districts:
+                    first_line.setdefault(district, index)
 
             # 자치구별 정보 추출
-            for district, info in SEOUL_DISTRICTS.items():
-                if district in text:
-                    # 해당 구 관련 텍스트 블록 추출
-                    lines = text.split("\n")
-                    district_lines = []
-                    in_district_section = False
-
-                    for line in lines:
-                        if district in line:
-                            in_district_section = True
-
-                        if in_district_section:
-                            district_lines.append(line)
-
-                            # 다른 구 이름이 나오면 종료
-                            other_districts = [d for d in SEOUL_DISTRICTS.keys() if d != district]
-                            if any(d in line for d in other_districts) and district not in line:
-                                break
-
-                    if district_lines:
-                        routes.append({
-                            "district": district,
-                            "raw_text": "\n".join(district_lines[:50]),  # 최대 50줄
-                            "source": source_url
-                        })
+            for district in sorted(first_line, key=_DISTRICT_ORDER.__getitem__):
+                index = first_line[district]
+                start = mentions[index][0]
+                end = None
+
+                # 다른 구만 언급된 줄이 나오면 그 줄까지 포함하고 종료
+                for _, line_end, districts in mentions[index + 1:]:
+                    if district not in districts:
+                        end = line_end
+                        break
+
+                block = text[start:end]
+                routes.append({
+                    "district": district,
+                    "raw_text": "\n".join(block.split("\n", 50)[:50]),  # 최대 50줄
+                    "source": source_url
+                })
 
         return routes
 
-    def crawl_main_sources(self) -> List[Dict]:
-        """공식 소스 크롤링"""
-        results = []
-
-        for source in OFFICIAL_SOURCES:
-            logger.info(f"크롤링: {source['name']} ({source['url']})")
+    @staticmethod
+    def _district_mentions(text: str) -> List[Tuple[int, Optional[int], set]]:
+        """자치구가 언급된 줄의 (시작 위치, 끝 위치, 언급된 구) 목록"""
+        mentions = []
 
-            html = self.fetch_page(source["url"])
-            if not html:
+        for match in _DISTRICT_PATTERN.finditer(text):
+            if mentions and (mentions[-1][1] is None or match.start() < mentions[-1][1]):
+                mentions[-1][2].add(match.group())
                 continue
 
-            soup = BeautifulSoup(html, "lxml")
+            line_start = text.rfind("\n", 0, match.start()) + 1
+            line_end = text.find("\n", match.end())
+            mentions.append((line_start, line_end if line_end != -1 else None, {match.group()}))
 
-            # 자치구 링크 추출
-            district_links = self.extract_district_links(soup, source["url"])
-            logger.info(f"  발견된 자치구 링크: {len(district_links)}개")
+        return mentions
 
-            # 첨부파일 추출
-            attachments = self.extract_attachments(soup, source["url"])
-            logger.info(f"  발견된 첨부파일: {len(attachments)}개")
+    async def _crawl_source(self, source: Dict, started: str) -> Optional[Dict]:
+        """공식 소스 한 곳 크롤링"""
+        async with self.semaphore:
+            logger.info(f"크롤링: {source['name']} ({source['url']})")
 
-            # 본문 노선 정보 추출
-            routes = self.extract_route_info(soup, source["url"])
+            tree = await self.fetch_page(source["url"])
+            if tree is None:
+                return None
+
+            # 자치구 링크 / 첨부파일 / 본문 노선 정보 추출
+            district_links, attachments, routes = self._extract_all(tree, source["url"])
+            logger.info(f"  발견된 자치구 링크: {len(district_links)}개")
+            logger.info(f"  발견된 첨부파일: {len(attachments)}개")
             logger.info(f"  추출된 노선 정보: {len(routes)}개")
 
-            results.append({
+            await asyncio.sleep(1)  # 예의 바른 크롤링
+
+            return {
                 "source": source,
                 "district_links": district_links,
                 "attachments": attachments,
                 "routes": routes,
-                "crawled_at": time.strftime("%Y-%m-%d %H:%M:%S")
-            })
-
-            time.sleep(1)  # 예의 바른 크롤링
-
-        return results
+                "crawled_at": started
+            }
 
-    def crawl_district_pages(self, district_links: List[Dict]) -> List[Dict]:
-        """자치구 개별 페이지 크롤링"""
-        results = []
+    async def crawl_main_sources(self, started: Optional[str] = None) -> List[Dict]:
+        """공식 소스 크롤링 (동시 요청, started: 배치 시작 시각)"""
+        started = started or time.strftime("%Y-%m-%d %H:%M:%S")
+        results = await asyncio.gather(
+            *[self._crawl_source(source, started) for source in OFFICIAL_SOURCES]
+        )
+        return [result for result in results if result]
 
-        for link in district_links:
+    async def _crawl_district_page(self, link: Dict, started: str) -> Optional[Dict]:
+        """자치구 개별 페이지 하나 크롤링"""
+        async with self.semaphore:
             logger.info(f"자치구 페이지 크롤링: {link['district']} ({link['url']})")
 
-            html = self.fetch_page(link["url"])
-            if not html:
-                continue
-
-            soup = BeautifulSoup(html, "lxml")
+            tree = await self.fetch_page(link["url"])
+            if tree is None:
+                return None
 
-            # 첨부파일 추출
-            attachments = self.extract_attachments(soup, link["url"])
+            # 첨부파일 / 노선 정보 추출
+            _, attachments, routes = self._extract_all(tree, link["url"], with_links=False)
 
-            # 노선 정보 추출
-            routes = self.extract_route_info(soup, link["url"])
+            await asyncio.sleep(1)
 
-            results.append({
+            return {
                 "district": link["district"],
                 "url": link["url"],
                 "attachments": attachments,
                 "routes": routes,
-                "crawled_at": time.strftime("%Y-%m-%d %H:%M:%S")
-            })
+                "crawled_at": started
+            }
 
-            time.sleep(1)
+    async def crawl_district_pages(self, district_links: List[Dict], started: Optional[str] = None) -> List[Dict]:
+        """자치구 개별 페이지 크롤링 (동시 요청, started: 배치 시작 시각)"""
+        started = started or time.strftime("%Y-%m-%d %H:%M:%S")
+        results = await asyncio.gather(
+            *[self._crawl_district_page(link, started) for link in district_links]
+        )
+        return [result for result in results if result]
 
-        return results
+    async def is_unchanged(self, url: str, save_path: Path) -> bool:
+        """HEAD 요청으로 이미 받은 첨부파일이 그대로인지 확인"""
+        cached = self.http_cache.get(url)
+        if not cached or cached.get("path") != str(save_path) or not save_path.exists():
+            return False
 
-    def download_attachment(self, url: str, save_path: Path) -> bool:
-        """첨부파일 다운로드"""
         try:
-            response = self.session.get(url, timeout=30, stream=True)
-
-            if response.status_code == 200:
-                with open(save_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                logger.info(f"다운로드 완료: {save_path.name}")
+            timeout = aiohttp.ClientTimeout(total=CRAWL_CONFIG["timeout"])
+            async with self.session.head(url, timeout=timeout, allow_redirects=True) as response:
+                if response.status != 200:
+                    return False
+
+                etag = response.headers.get("ETag")
+                if etag:
+                    return etag == cached.get("etag")
+
+                last_modified = response.headers.get("Last-Modified")
+                return bool(last_modified) and last_modified == cached.get("last_modified")
+
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return False
+
+    async def download_attachment(self, url: str, save_path: Path) -> bool:
+        """첨부파일 다운로드 (스트리밍 저장)"""
+        async with self.download_semaphore:
+            if await self.is_unchanged(url, save_path):
+                logger.info(f"변경 없음 (다운로드 생략): {save_path.name}")
                 return True
 
-        except Exception as e:
-            logger.error(f"다운로드 실패: {e}")
+            try:
+                # 큰 PDF도 받을 수 있도록 전체가 아닌 소켓 단위 타임아웃 적용
+                timeout = aiohttp.ClientTimeout(sock_connect=30, sock_read=30)
+                async with self.session.get(url, timeout=timeout) as response:
+                    if response.status == 200:
+                        sha256 = hashlib.sha256()
+                        async with aiofiles.open(save_path, "wb") as f:
+                            async for chunk in response.content.iter_chunked(CRAWL_CONFIG["chunk_size"]):
+                                sha256.update(chunk)
+                                await f.write(chunk)
+                        self._remember(url, response.headers, sha256.hexdigest(), save_path)
+                        logger.info(f"다운로드 완료: {save_path.name}")
+                        return True
+
+            except Exception as e:
+                logger.error(f"다운로드 실패: {e}")
 
         return False
 
     def run(self, download_files: bool = True) -> Dict:
         """전체 크롤링 실행"""
+        # 배치 내 모든 결과가 같은 시각을 쓰도록 시작 시각을 한 번만 계산
+        started = time.strftime("%Y-%m-%d %H:%M:%S")
+        return asyncio.run(self._run_async(download_files, started))
+
+    async def _run_async(self, download_files: bool, started: str) -> Dict:
+        """전체 크롤링 실행 (비동기 본체)"""
         logger.info("=" * 50)
         logger.info("에이전트 1: 자치구 공지 URL 크롤러 시작")
         logger.info("=" * 50)
 
+        # 연결 재사용: keep-alive 유지 + DNS 결과 캐시
+        connector = aiohttp.TCPConnector(
+            limit_per_host=CRAWL_CONFIG["concurrency"],
+            keepalive_timeout=CRAWL_CONFIG["keepalive_timeout"],
+            ttl_dns_cache=300
+        )
+        self.semaphore = asyncio.Semaphore(CRAWL_CONFIG["concurrency"])
+        self.download_semaphore = asyncio.Semaphore(CRAWL_CONFIG["download_concurrency"])
+
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector) as session:
+            self.session = session
+            try:
+                return await self._crawl_all(download_files, started)
+            finally:
+                self.session = None
+
+    async def _crawl_all(self, download_files: bool, started: str) -> Dict:
+        """소스 → 자치구 페이지 → 첨부파일 순서로 수집"""
         # 메인 소스 크롤링
-        main_results = self.crawl_main_sources()
+        main_results = await self.crawl_main_sources(started)
 
         # 자치구 링크 수집
         all_district_links = []
         for result in main_results:
             all_district_links.extend(result.get("district_links", []))
 
-        # 중복 제거
-        seen_urls = set()
+        # 중복 제거 (이미 크롤링한 공식 소스 URL 포함)
+        seen_urls = {result["source"]["url"] for result in main_results}
         unique_links = []
         for link in all_district_links:
             if link["url"] not in seen_urls:
@@ -251,7 +471,7 @@ class DistrictCrawler:
                 unique_links.append(link)
 
         # 자치구 페이지 크롤링
-        district_results = self.crawl_district_pages(unique_links)
+        district_results = await self.crawl_district_pages(unique_links, started)
 
         # 첨부파일 다운로드
         downloaded_files = []
@@ -262,15 +482,21 @@ class DistrictCrawler:
             for result in district_results:
                 all_attachments.extend(result.get("attachments", []))
 
+            # 같은 파일명은 한 번만 받는다 (마지막 URL 우선, 동시 쓰기 방지)
+            pdf_targets = {}
             for attachment in all_attachments:
                 if attachment["type"] == "pdf":
                     filename = f"{attachment['filename']}"
                     if not filename.endswith(".pdf"):
                         filename += ".pdf"
-                    save_path = RAW_DIR / filename
+                    pdf_targets[RAW_DIR / filename] = attachment["url"]
 
-                    if self.download_attachment(attachment["url"], save_path):
-                        downloaded_files.append(str(save_path))
+            succeeded = await asyncio.gather(
+                *[self.download_attachment(url, path) for path, url in pdf_targets.items()]
+            )
+            downloaded_files = [
+                str(path) for path, ok in zip(pdf_targets, succeeded) if ok
+            ]
 
         # 결과 저장
         output = {
@@ -281,13 +507,14 @@ class DistrictCrawler:
                 "total_sources": len(main_results),
                 "total_district_pages": len(district_results),
                 "total_attachments": len(downloaded_files),
-                "crawled_at": time.strftime("%Y-%m-%d %H:%M:%S")
+                "crawled_at": started
             }
         }
 
-        output_path = RAW_DIR / "crawl_results.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        self.save_http_cache()
+
+        # 다음 스테이지(NLP)만 읽는 파일이므로 기본은 압축 .json.gz
+        output_path = dump_artifact(output, RAW_DIR / "crawl_results.json", OUTPUT_CONFIG["pretty"])
 
         logger.info(f"\n크롤링 완료! 결과: {output_path}")
 
@@ -5,22 +5,108 @@
 - 결과 캐싱으로 API 호출 최소화
 """
 
-import requests
-import json
-import time
+import re
+import asyncio
+import unicodedata
+import aiohttp
+import numpy as np
+from aiolimiter import AsyncLimiter
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Iterator, Optional, Tuple, List
 import sys
 
-sys.path.append(str(Path(__file__).parent.parent))
+# 패키지(agents.*)로 임포트되면 프로젝트 루트가 이미 sys.path에 있으므로
+# 스크립트로 직접 실행할 때만 루트 경로 추가
+if not __package__:
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
 from config import (
     KAKAO_API_KEY, NAVER_CLIENT_ID, NAVER_CLIENT_SECRET,
-    GEOCODE_CONFIG, PROCESSED_DIR
+    GEOCODE_CONFIG, PROCESSED_DIR, OUTPUT_CONFIG
 )
+from jsonio import load_json, dump_json, dump_artifact, find_artifact
 
 logger = logging.getLogger(__name__)
 
+# 서울 주요 지하철역 좌표 (하드코딩 폴백)
+_LANDMARKS = {
+    "강남역": (37.4979, 127.0276),
+    "서울역": (37.5547, 126.9707),
+    "홍대입구역": (37.5571, 126.9246),
+    "잠실역": (37.5132, 127.1001),
+    "신촌역": (37.5599, 126.9422),
+    "여의도역": (37.5216, 126.9244),
+    "영등포역": (37.5156, 126.9074),
+    "사당역": (37.4765, 126.9816),
+    "건대입구역": (37.5403, 127.0702),
+    "왕십리역": (37.5614, 127.0378),
+    "합정역": (37.5495, 126.9138),
+    "신림역": (37.4842, 126.9293),
+    "노원역": (37.6558, 127.0617),
+    "종로3가역": (37.5710, 126.9920),
+    "을지로입구역": (37.5660, 126.9825),
+    "시청역": (37.5659, 126.9771),
+    "교대역": (37.4934, 127.0145),
+    "역삼역": (37.5006, 127.0366),
+    "선릉역": (37.5045, 127.0490),
+    "삼성역": (37.5089, 127.0630),
+    "종합운동장역": (37.5107, 127.0739),
+    "구로디지털단지역": (37.4851, 126.9015),
+    "가산디지털단지역": (37.4816, 126.8828),
+    "문래역": (37.5178, 126.8945),
+    "당산역": (37.5349, 126.9025),
+}
+
+# 자치구 중심 좌표
+_DISTRICT_CENTERS = {
+    "종로구": (37.5735, 126.9790),
+    "중구": (37.5641, 126.9979),
+    "용산구": (37.5326, 126.9907),
+    "성동구": (37.5634, 127.0369),
+    "광진구": (37.5385, 127.0823),
+    "동대문구": (37.5744, 127.0396),
+    "중랑구": (37.6063, 127.0927),
+    "성북구": (37.5894, 127.0167),
+    "강북구": (37.6396, 127.0257),
+    "도봉구": (37.6688, 127.0471),
+    "노원구": (37.6543, 127.0568),
+    "은평구": (37.6027, 126.9291),
+    "서대문구": (37.5791, 126.9368),
+    "마포구": (37.5663, 126.9019),
+    "양천구": (37.5170, 126.8666),
+    "강서구": (37.5510, 126.8495),
+    "구로구": (37.4954, 126.8874),
+    "금천구": (37.4569, 126.8955),
+    "영등포구": (37.5264, 126.8963),
+    "동작구": (37.5124, 126.9393),
+    "관악구": (37.4784, 126.9516),
+    "서초구": (37.4837, 127.0324),
+    "강남구": (37.5172, 127.0473),
+    "송파구": (37.5145, 127.1059),
+    "강동구": (37.5301, 127.1238),
+}
+
+# '역'을 뗀 랜드마크 이름 → 좌표 (한 번의 정규식 스캔으로 매칭)
+_LANDMARK_MAP = {name.removesuffix("역"): coords for name, coords in _LANDMARKS.items()}
+_LANDMARK_NAMES = list(_LANDMARK_MAP)
+
+# 위치마다 가장 긴 이름을 겹쳐서 찾는 스캔 (lookahead라 매칭이 서로 겹쳐도 모두 반환)
+_LANDMARK_PATTERN = re.compile(
+    "(?=({}))".format("|".join(sorted(map(re.escape, _LANDMARK_NAMES), key=len, reverse=True)))
+)
+
+# 매칭된 이름의 우선순위 = 그 이름 안에 포함된 랜드마크 중 가장 앞선 정의 순서
+# (긴 이름이 매칭되면 그 안의 짧은 이름도 장소명에 들어 있으므로 함께 고려)
+_LANDMARK_RANK = {
+    name: min(i for i, other in enumerate(_LANDMARK_NAMES) if other in name)
+    for name in _LANDMARK_NAMES
+}
+
+
+def _norm(text: str) -> str:
+    """캐시 키용 정류장명 정규화 (NFKC + 앞뒤 공백 제거 + 연속 공백 축약)"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
 
 class GeocodingService:
     """정류장 좌표 변환 서비스"""
@@ -32,6 +118,16 @@ class GeocodingService:
         self.cache_file = GEOCODE_CONFIG["cache_file"]
         self.cache = self.load_cache()
 
+        # geocode_routes 실행 중에만 생성되는 비동기 세션 / 호출 제한
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.limiter: Optional[AsyncLimiter] = None
+
+        # geocode_routes 결과 좌표 (열 단위 배열, as_numpy()로 조회)
+        self.names: List[str] = []
+        self.lats = np.empty(0, dtype=np.float64)
+        self.lngs = np.empty(0, dtype=np.float64)
+
         # API 호출 통계
         self.stats = {
             "cache_hits": 0,
@@ -39,12 +135,16 @@ class GeocodingService:
             "failures": 0
         }
 
-    def load_cache(self) -> Dict:
-        """캐시 로드"""
-        if self.cache_enabled and self.cache_file.exists():
+    def load_cache(self) -> Dict[str, Optional[Tuple[float, float]]]:
+        """캐시 로드 (메모리에서는 캐시 키 → (위도, 경도) 튜플로 보관)"""
+        cache_path = find_artifact(self.cache_file) if self.cache_enabled else None
+        if cache_path:
             try:
-                with open(self.cache_file, encoding="utf-8") as f:
-                    return json.load(f)
+                raw = load_json(cache_path)
+                return {
+                    sys.intern(_norm(key)): (value["lat"], value["lng"]) if value else None
+                    for key, value in raw.items()
+                }
             except Exception as e:
                 logger.warning(f"캐시 로드 실패: {e}")
         return {}
@@ -54,8 +154,12 @@ class GeocodingService:
         if self.cache_enabled:
             try:
                 self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(self.cache_file, "w", encoding="utf-8") as f:
-                    json.dump(self.cache, f, ensure_ascii=False, indent=2)
+                # 파일 형식은 {"lat", "lng"} 유지, 기계 전용이므로 기본은 압축 .json.gz
+                raw = {
+                    key: {"lat": coords[0], "lng": coords[1]} if coords else None
+                    for key, coords in self.cache.items()
+                }
+                dump_artifact(raw, self.cache_file, OUTPUT_CONFIG["pretty"])
             except Exception as e:
                 logger.warning(f"캐시 저장 실패: {e}")
 
@@ -71,7 +175,24 @@ class GeocodingService:
 
         return query
 
-    def geocode_kakao(self, query: str) -> Optional[Tuple[float, float]]:
+    def api_headers(self) -> Dict[str, str]:
+        """지오코딩 제공자별 인증 헤더"""
+        if self.provider == "kakao":
+            return {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
+        if self.provider == "naver":
+            return {
+                "X-Naver-Client-Id": NAVER_CLIENT_ID,
+                "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
+            }
+        return {}
+
+    async def request_json(self, url: str, params: Dict) -> Dict:
+        """동시 호출 수 / 초당 호출 수 제한 안에서 API 요청"""
+        async with self.semaphore, self.limiter:
+            async with self.session.get(url, params=params) as response:
+                return await response.json(content_type=None)
+
+    async def geocode_kakao(self, query: str) -> Optional[Tuple[float, float]]:
         """카카오 API 지오코딩"""
         if KAKAO_API_KEY == "YOUR_KAKAO_REST_API_KEY":
             logger.warning("카카오 API 키가 설정되지 않았습니다")
@@ -79,11 +200,9 @@ class GeocodingService:
 
         try:
             url = "https://dapi.kakao.com/v2/local/search/keyword.json"
-            headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
             params = {"query": query, "size": 1}
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            data = response.json()
+            data = await self.request_json(url, params)
 
             if data.get("documents"):
                 doc = data["documents"][0]
@@ -94,7 +213,7 @@ class GeocodingService:
 
         return None
 
-    def geocode_naver(self, query: str) -> Optional[Tuple[float, float]]:
+    async def geocode_naver(self, query: str) -> Optional[Tuple[float, float]]:
         """네이버 API 지오코딩"""
         if not NAVER_CLIENT_ID or not NAVER_CLIENT_SECRET:
             logger.warning("네이버 API 키가 설정되지 않았습니다")
@@ -102,14 +221,9 @@ class GeocodingService:
 
         try:
             url = "https://openapi.naver.com/v1/search/local.json"
-            headers = {
-                "X-Naver-Client-Id": NAVER_CLIENT_ID,
-                "X-Naver-Client-Secret": NAVER_CLIENT_SECRET
-            }
             params = {"query": query, "display": 1}
 
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-            data = response.json()
+            data = await self.request_json(url, params)
 
             if data.get("items"):
                 item = data["items"][0]
@@ -124,85 +238,27 @@ class GeocodingService:
 
     def geocode_fallback(self, place: str, district: str = None) -> Optional[Tuple[float, float]]:
         """폴백: 주요 랜드마크 좌표 반환"""
-        # 서울 주요 지하철역 좌표 (하드코딩 폴백)
-        landmarks = {
-            "강남역": (37.4979, 127.0276),
-            "서울역": (37.5547, 126.9707),
-            "홍대입구역": (37.5571, 126.9246),
-            "잠실역": (37.5132, 127.1001),
-            "신촌역": (37.5599, 126.9422),
-            "여의도역": (37.5216, 126.9244),
-            "영등포역": (37.5156, 126.9074),
-            "사당역": (37.4765, 126.9816),
-            "건대입구역": (37.5403, 127.0702),
-            "왕십리역": (37.5614, 127.0378),
-            "합정역": (37.5495, 126.9138),
-            "신림역": (37.4842, 126.9293),
-            "노원역": (37.6558, 127.0617),
-            "종로3가역": (37.5710, 126.9920),
-            "을지로입구역": (37.5660, 126.9825),
-            "시청역": (37.5659, 126.9771),
-            "교대역": (37.4934, 127.0145),
-            "역삼역": (37.5006, 127.0366),
-            "선릉역": (37.5045, 127.0490),
-            "삼성역": (37.5089, 127.0630),
-            "종합운동장역": (37.5107, 127.0739),
-            "구로디지털단지역": (37.4851, 126.9015),
-            "가산디지털단지역": (37.4816, 126.8828),
-            "문래역": (37.5178, 126.8945),
-            "당산역": (37.5349, 126.9025),
-        }
-
-        # 자치구 중심 좌표
-        district_centers = {
-            "종로구": (37.5735, 126.9790),
-            "중구": (37.5641, 126.9979),
-            "용산구": (37.5326, 126.9907),
-            "성동구": (37.5634, 127.0369),
-            "광진구": (37.5385, 127.0823),
-            "동대문구": (37.5744, 127.0396),
-            "중랑구": (37.6063, 127.0927),
-            "성북구": (37.5894, 127.0167),
-            "강북구": (37.6396, 127.0257),
-            "도봉구": (37.6688, 127.0471),
-            "노원구": (37.6543, 127.0568),
-            "은평구": (37.6027, 126.9291),
-            "서대문구": (37.5791, 126.9368),
-            "마포구": (37.5663, 126.9019),
-            "양천구": (37.5170, 126.8666),
-            "강서구": (37.5510, 126.8495),
-            "구로구": (37.4954, 126.8874),
-            "금천구": (37.4569, 126.8955),
-            "영등포구": (37.5264, 126.8963),
-            "동작구": (37.5124, 126.9393),
-            "관악구": (37.4784, 126.9516),
-            "서초구": (37.4837, 127.0324),
-            "강남구": (37.5172, 127.0473),
-            "송파구": (37.5145, 127.1059),
-            "강동구": (37.5301, 127.1238),
-        }
-
-        # 랜드마크 매칭
-        for landmark, coords in landmarks.items():
-            if landmark.replace("역", "") in place:
-                return coords
+        # 랜드마크 매칭 (장소명에 여러 개가 있으면 정의 순서가 앞선 랜드마크 우선)
+        ranks = [_LANDMARK_RANK[match.group(1)] for match in _LANDMARK_PATTERN.finditer(place)]
+        if ranks:
+            return _LANDMARK_MAP[_LANDMARK_NAMES[min(ranks)]]
 
         # 자치구 중심 반환
-        if district and district in district_centers:
-            return district_centers[district]
+        if district and district in _DISTRICT_CENTERS:
+            return _DISTRICT_CENTERS[district]
 
         return None
 
-    def geocode(self, place: str, district: str = None) -> Optional[Tuple[float, float]]:
+    async def geocode_async(self, place: str, district: str = None) -> Optional[Tuple[float, float]]:
         """정류장 좌표 조회 (캐시 + API + 폴백)"""
-        # 캐시 키 생성
+        # 캐시 키 생성 (표기 차이만 있는 정류장명은 같은 키)
+        place = _norm(place)
         cache_key = f"{place}_{district or ''}"
 
-        # 캐시 확인
+        # 캐시 확인 (API 호출 제한을 거치지 않음)
         if cache_key in self.cache:
             self.stats["cache_hits"] += 1
-            cached = self.cache[cache_key]
-            return (cached["lat"], cached["lng"]) if cached else None
+            return self.cache[cache_key]
 
         # 검색어 정규화
         query = self.normalize_query(place, district)
@@ -211,27 +267,75 @@ class GeocodingService:
         coords = None
 
         if self.provider == "kakao":
-            coords = self.geocode_kakao(query)
+            coords = await self.geocode_kakao(query)
         elif self.provider == "naver":
-            coords = self.geocode_naver(query)
+            coords = await self.geocode_naver(query)
 
         # API 실패 시 폴백
         if not coords:
             coords = self.geocode_fallback(place, district)
 
         # 결과 캐싱
+        self.cache[sys.intern(cache_key)] = coords
         if coords:
-            self.cache[cache_key] = {"lat": coords[0], "lng": coords[1]}
             self.stats["api_calls"] += 1
         else:
-            self.cache[cache_key] = None
             self.stats["failures"] += 1
 
-        # API 호출 간격
-        time.sleep(0.1)
-
         return coords
 
+    async def geocode_many(
+        self, places: List[Tuple[str, Optional[str]]]
+    ) -> Dict[Tuple[str, Optional[str]], Optional[Tuple[float, float]]]:
+        """(정류장명, 자치구) 목록을 동시에 좌표 변환 (결과 키는 정규화된 정류장명)"""
+        unique = list(dict.fromkeys((_norm(place), district) for place, district in places))
+
+        # 중복 조회는 순차 조회였다면 캐시에서 응답했을 요청이므로 캐시 히트로 집계
+        self.stats["cache_hits"] += len(places) - len(unique)
+        timeout = aiohttp.ClientTimeout(total=10)
+
+        # 같은 API 호스트로의 연결을 keep-alive로 재사용 (요청마다 TLS 핸드셰이크 방지)
+        connector = aiohttp.TCPConnector(
+            limit_per_host=GEOCODE_CONFIG["concurrency"],
+            keepalive_timeout=GEOCODE_CONFIG["keepalive_timeout"],
+            ttl_dns_cache=300
+        )
+
+        async with aiohttp.ClientSession(
+            headers=self.api_headers(), timeout=timeout, connector=connector
+        ) as session:
+            self.session = session
+            self.semaphore = asyncio.Semaphore(GEOCODE_CONFIG["concurrency"])
+            self.limiter = AsyncLimiter(GEOCODE_CONFIG["rate_limit"], 1)
+            try:
+                results = await asyncio.gather(
+                    *[self.geocode_async(place, district) for place, district in unique]
+                )
+            finally:
+                self.session = None
+
+        return dict(zip(unique, results))
+
+    def geocode(self, place: str, district: str = None) -> Optional[Tuple[float, float]]:
+        """단일 정류장 좌표 조회"""
+        return asyncio.run(self.geocode_many([(place, district)]))[(_norm(place), district)]
+
+    @staticmethod
+    def iter_district_routes(routes_data: Dict) -> Iterator[Tuple[Optional[str], Dict]]:
+        """추출 결과의 (자치구, 노선) 순회
+
+        평탄한 routes 목록(각 노선의 district 필드)을 읽고,
+        이전 형식의 자치구별 districts 묶음도 그대로 지원
+        """
+        if "routes" in routes_data:
+            for route in routes_data["routes"]:
+                yield route.get("district"), route
+            return
+
+        for district, routes in routes_data.get("districts", {}).items():
+            for route in routes:
+                yield district, route
+
     def geocode_routes(self, routes_data: Dict) -> Dict:
         """노선 데이터의 모든 정류장 좌표 변환"""
         result = {
@@ -239,41 +343,72 @@ class GeocodingService:
             "stats": {}
         }
 
-        for district, routes in routes_data.get("districts", {}).items():
-            district_data = {
-                "district": district,
-                "routes": []
+        district_routes = list(self.iter_district_routes(routes_data))
+
+        # 전체 노선의 정류장을 모아 중복 제거 후 한 번에 동시 조회
+        places = [
+            (stop_name, district)
+            for district, route in district_routes
+            for stop_name in route.get("stops", [])
+        ]
+        coords_map = asyncio.run(self.geocode_many(places)) if places else {}
+
+        # 좌표는 정류장별 dict 대신 열 단위 배열(이름 / 위도 / 경도)에 보관
+        names = []
+        lats = np.empty(len(places), dtype=np.float64)
+        lngs = np.empty(len(places), dtype=np.float64)
+        route_spans = []  # (district, route_data, 시작 인덱스, 끝 인덱스)
+
+        for district, route in district_routes:
+            route_data = {
+                "name": route.get("name", f"{district} 셔틀"),
+                "hours": route.get("hours"),
+                "interval": route.get("interval"),
+                "stops": []
             }
+            start = len(names)
 
-            for route in routes:
-                route_data = {
-                    "name": route.get("name", f"{district} 셔틀"),
-                    "hours": route.get("hours"),
-                    "interval": route.get("interval"),
-                    "stops": []
-                }
+            for stop_name in route.get("stops", []):
+                coords = coords_map[(_norm(stop_name), district)]
+
+                if coords:
+                    lats[len(names)], lngs[len(names)] = coords
+                    names.append(stop_name)
+                else:
+                    logger.warning(f"좌표 변환 실패: {stop_name}")
+
+            route_spans.append((district, route_data, start, len(names)))
 
-                for stop_name in route.get("stops", []):
-                    coords = self.geocode(stop_name, district)
+        self.names = names
+        self.lats = lats[:len(names)]
+        self.lngs = lngs[:len(names)]
 
-                    if coords:
-                        route_data["stops"].append({
-                            "name": stop_name,
-                            "lat": coords[0],
-                            "lng": coords[1]
-                        })
-                    else:
-                        logger.warning(f"좌표 변환 실패: {stop_name}")
+        # JSON 출력 시점에만 정류장 dict 생성
+        lat_list = self.lats.tolist()
+        lng_list = self.lngs.tolist()
+        district_index = {}
 
-                if route_data["stops"]:
-                    district_data["routes"].append(route_data)
+        for district, route_data, start, end in route_spans:
+            if start == end:
+                continue
 
-            if district_data["routes"]:
-                result["districts"].append(district_data)
+            route_data["stops"] = [
+                {"name": name, "lat": lat, "lng": lng}
+                for name, lat, lng in zip(names[start:end], lat_list[start:end], lng_list[start:end])
+            ]
+
+            if district not in district_index:
+                district_index[district] = {"district": district, "routes": []}
+                result["districts"].append(district_index[district])
+            district_index[district]["routes"].append(route_data)
 
         result["stats"] = self.stats
         return result
 
+    def as_numpy(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """마지막 geocode_routes 결과의 (정류장명, 위도 배열, 경도 배열) 반환"""
+        return self.names, self.lats, self.lngs
+
     def run(self) -> Dict:
         """전체 지오코딩 실행"""
         logger.info("=" * 50)
@@ -286,8 +421,7 @@ class GeocodingService:
             logger.error(f"입력 파일 없음: {input_path}")
             return {"error": "Input file not found"}
 
-        with open(input_path, encoding="utf-8") as f:
-            routes_data = json.load(f)
+        routes_data = load_json(input_path)
 
         logger.info(f"입력 데이터: {routes_data.get('total_routes', 0)}개 노선")
 
@@ -299,8 +433,7 @@ class GeocodingService:
 
         # 결과 저장
         output_path = PROCESSED_DIR / "geocoded_routes.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, ensure_ascii=False, indent=2)
+        dump_json(result, output_path)
 
         logger.info(f"\n지오코딩 완료! 결과: {output_path}")
         logger.info(f"  캐시 히트: {self.stats['cache_hits']}")
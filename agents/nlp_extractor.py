@@ -6,18 +6,113 @@
 """
 
 import re
-import json
+import bisect
+import itertools
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-from collections import defaultdict
+from collections import Counter
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
-from config import STOP_PATTERNS, SEOUL_DISTRICTS, PROCESSED_DIR
+from config import STOP_PATTERNS, SEOUL_DISTRICTS, PROCESSED_DIR, RAW_DIR
+from jsonio import dump_json, find_artifact, iter_json_items
 
 logger = logging.getLogger(__name__)
 
+# 정류장 패턴 정규식
+_STOP_RE = re.compile(
+    r"([가-힣]{2,15}(?:역|정류장|사거리|삼거리|오거리|주민센터|구청|시장|공원|학교|병원|아파트|마을|입구|앞|건너편?)\s*\d*번?\s*(?:출구)?)"
+)
+
+# 시간 패턴
+# 선택 요소 사이에 \s* 를 연달아 두지 않아 공백이 길어도 백트래킹이 폭증하지 않음
+_TIME_RE = re.compile(
+    r"(\d{1,2})\s*[:시]\s*(?:(\d{2})\s*)?[~\-]\s*(\d{1,2})\s*[:시]\s*(\d{2})?"
+)
+
+# 배차간격 패턴
+# 숫자는 항상 연속된 숫자 전체로만 매칭 (긴 숫자/공백 열에서도 선형 시간)
+_INTERVAL_RE = re.compile(
+    r"(?<!\d)(\d+)(?!\d)\s*(?:[~\-]\s*)?(?:(\d+)(?!\d)\s*)?분\s*(?:간격|배차)?"
+)
+
+# 노선명 패턴
+_ROUTE_RE = re.compile(
+    r"([가-힣]+\s*(?:셔틀|순환|노선|버스)?\s*\d*\s*(?:호선|번)?)"
+)
+
+# 텍스트 정제 (연속 공백, 특수문자)
+_CLEAN_WS_RE = re.compile(r"\s+")
+_CLEAN_PUNCT_RE = re.compile(r"[^\w\s가-힣\d:~\-→↔]")
+
+# 줄을 정류장 후보 조각으로 나누는 구분자
+_SPLIT_RE = re.compile(r"[,\s→↔\-]")
+
+# 줄바꿈을 제외한 공백 (줄 단위 정제용)
+_LINE_SPACE_RE = re.compile(r"[^\S\n]+")
+
+# 중복 판정용 정규화 (공백, 숫자 제거)
+_DEDUP_RE = re.compile(r"[\s\d]")
+
+
+def _dedup_key(stop_name: str) -> str:
+    """중복 판정용 정규화 이름 (공백, 숫자 제거)
+
+    글자로만 된 이름(대부분의 정류장명)은 지울 문자가 없으므로 정규식을 건너뜀
+    """
+    if stop_name.isalpha():
+        return stop_name
+    return _DEDUP_RE.sub("", stop_name)
+
+# 정류장 키워드 스캔: 모든 위치에서 (겹치는 것 포함) 키워드 출현을 한 번에 찾음
+# 첫 글자 문자 집합을 먼저 검사해 후보가 아닌 위치는 빠르게 건너뜀
+_KEYWORD_SCAN = re.compile(
+    "(?=[{}])(?=({}))".format(
+        re.escape("".join(sorted({kw[0] for kw in STOP_PATTERNS["keywords"]}))),
+        "|".join(sorted(map(re.escape, STOP_PATTERNS["keywords"]), key=len, reverse=True))
+    )
+)
+
+# 키워드 → 설정 순서상 순번 (같은 위치에서 시작하는 짧은 키워드는 긴 키워드에 가려지므로
+# 접두어 키워드 중 가장 앞선 순번을 사용)
+_KEYWORD_RANK = {
+    keyword: min(i for i, other in enumerate(STOP_PATTERNS["keywords"]) if keyword.startswith(other))
+    for keyword in STOP_PATTERNS["keywords"]
+}
+
+# 자치구명 스캔: 텍스트 전체에서 자치구명 출현 위치를 한 번에 찾음 (겹치는 것 포함)
+_DISTRICT_SCAN = re.compile(
+    "(?=[{}])(?=({}))".format(
+        re.escape("".join(sorted({name[0] for name in SEOUL_DISTRICTS}))),
+        "|".join(sorted(map(re.escape, SEOUL_DISTRICTS), key=len, reverse=True))
+    )
+)
+
+# 자치구 → 설정 순서상 순번 (한 줄에 여러 자치구가 있으면 앞선 자치구 우선)
+_DISTRICT_RANK = {district: i for i, district in enumerate(SEOUL_DISTRICTS)}
+
+# 제외 / 정류장 키워드 포함 여부 (각각 하나의 정규식으로 판정)
+_EXCLUDE_RE = re.compile("|".join(map(re.escape, STOP_PATTERNS["exclude"])))
+_KEYWORD_RE = re.compile("|".join(map(re.escape, STOP_PATTERNS["keywords"])))
+
+
+@lru_cache(maxsize=8192)
+def _is_valid_stop(stop_name: str) -> bool:
+    """정류장명 유효성 (같은 후보가 블록마다 반복되므로 결과를 캐시)"""
+    # 싼 검사부터: 길이 → 숫자만 → 제외 키워드 → 정류장 키워드
+    if not stop_name or not 3 <= len(stop_name) <= 30:
+        return False
+
+    if stop_name.isdigit():
+        return False
+
+    if _EXCLUDE_RE.search(stop_name) is not None:
+        return False
+
+    return _KEYWORD_RE.search(stop_name) is not None
+
 
 class StopExtractor:
     """정류장 및 노선 정보 추출기"""
@@ -27,37 +122,40 @@ class StopExtractor:
         self.exclude_keywords = STOP_PATTERNS["exclude"]
         self.districts = SEOUL_DISTRICTS
 
-        # 정류장 패턴 정규식
-        self.stop_pattern = re.compile(
-            r"([가-힣]{2,15}(?:역|정류장|사거리|삼거리|오거리|주민센터|구청|시장|공원|학교|병원|아파트|마을|입구|앞|건너편?)\s*\d*번?\s*(?:출구)?)"
-        )
-
-        # 시간 패턴
-        self.time_pattern = re.compile(
-            r"(\d{1,2})\s*[:시]\s*(\d{2})?\s*[~\-]\s*(\d{1,2})\s*[:시]\s*(\d{2})?"
-        )
-
-        # 배차간격 패턴
-        self.interval_pattern = re.compile(
-            r"(\d+)\s*[~\-]?\s*(\d+)?\s*분\s*(?:간격|배차)?"
-        )
+        # 제외 / 정류장 키워드 포함 여부를 한 번의 검색으로 판정
+        self._exclude_re = _EXCLUDE_RE
+        self._keyword_re = _KEYWORD_RE
 
-        # 노선명 패턴
-        self.route_name_pattern = re.compile(
-            r"([가-힣]+\s*(?:셔틀|순환|노선|버스)?\s*\d*\s*(?:호선|번)?)"
-        )
+        # 정규식은 모듈 로드 시 한 번만 컴파일
+        self.stop_pattern = _STOP_RE
+        self.time_pattern = _TIME_RE
+        self.interval_pattern = _INTERVAL_RE
+        self.route_name_pattern = _ROUTE_RE
 
     def clean_text(self, text: str) -> str:
         """텍스트 정제"""
         # 여러 공백을 하나로
-        text = re.sub(r"\s+", " ", text)
+        text = _CLEAN_WS_RE.sub(" ", text)
         # 특수문자 정리
-        text = re.sub(r"[^\w\s가-힣\d:~\-→↔]", " ", text)
+        text = _CLEAN_PUNCT_RE.sub(" ", text)
         return text.strip()
 
+    def clean_lines(self, text: str) -> List[str]:
+        """텍스트를 줄 단위로 정제 (각 줄에 clean_text를 적용한 결과와 같음)
+
+        줄바꿈은 남긴 채 전체 텍스트에 정규식을 한 번씩만 적용
+        """
+        text = _LINE_SPACE_RE.sub(" ", text)
+        text = _CLEAN_PUNCT_RE.sub(" ", text)
+        return [line.strip() for line in text.split("\n")]
+
     def extract_stops(self, text: str) -> List[str]:
-        """텍스트에서 정류장명 추출"""
+        """텍스트에서 정류장명 추출
+
+        유사 이름(공백, 숫자만 다른 이름)은 처음 나온 것만 남김
+        """
         stops = []
+        seen_normalized = set()
         cleaned = self.clean_text(text)
 
         # 정규식 매칭
@@ -65,51 +163,43 @@ class StopExtractor:
         for match in matches:
             stop_name = match.strip()
             if self.is_valid_stop(stop_name):
-                stops.append(stop_name)
+                normalized = _dedup_key(stop_name)
+                if normalized not in seen_normalized:
+                    seen_normalized.add(normalized)
+                    stops.append(stop_name)
 
         # 키워드 기반 추출 (정규식 놓친 것)
-        lines = text.split("\n")
-        for line in lines:
-            line = self.clean_text(line)
-
+        for line in self.clean_lines(text):
             # 제외 키워드 필터링
-            if any(ex in line for ex in self.exclude_keywords):
+            if self._exclude_re.search(line) is not None:
                 continue
 
-            # 정류장 키워드 포함 여부
-            for keyword in self.stop_keywords:
-                if keyword in line:
-                    # 해당 부분 추출
-                    parts = re.split(r"[,\s→↔\-]", line)
-                    for part in parts:
-                        part = part.strip()
-                        if keyword in part and self.is_valid_stop(part):
-                            if part not in stops:
-                                stops.append(part)
-
-        return self.deduplicate_stops(stops)
+            # 해당 부분 추출 (구분자는 모두 한 글자이므로 조각 시작 위치를 누적 계산)
+            parts = _SPLIT_RE.split(line)
+            starts = list(itertools.accumulate((len(part) + 1 for part in parts[:-1]), initial=0))
+
+            # 줄을 한 번 스캔해 키워드가 든 조각마다 가장 앞선 키워드 순번 기록
+            first_rank = {}
+            for match in _KEYWORD_SCAN.finditer(line):
+                index = bisect.bisect_right(starts, match.start()) - 1
+                rank = _KEYWORD_RANK[match.group(1)]
+                if rank < first_rank.get(index, len(_KEYWORD_RANK)):
+                    first_rank[index] = rank
+
+            # 키워드 순서 → 조각 순서로 추가
+            for index in sorted(first_rank, key=lambda i: (first_rank[i], i)):
+                part = parts[index].strip()
+                if self.is_valid_stop(part):
+                    normalized = _dedup_key(part)
+                    if normalized not in seen_normalized:
+                        seen_normalized.add(normalized)
+                        stops.append(part)
+
+        return stops
 
     def is_valid_stop(self, stop_name: str) -> bool:
         """유효한 정류장명인지 확인"""
-        if not stop_name or len(stop_name) < 2:
-            return False
-
-        # 제외 키워드 포함 여부
-        if any(ex in stop_name for ex in self.exclude_keywords):
-            return False
-
-        # 숫자만 있는 경우
-        if stop_name.isdigit():
-            return False
-
-        # 너무 짧거나 긴 경우
-        if len(stop_name) < 3 or len(stop_name) > 30:
-            return False
-
-        # 정류장 키워드 포함 여부
-        has_keyword = any(kw in stop_name for kw in self.stop_keywords)
-
-        return has_keyword
+        return _is_valid_stop(stop_name)
 
     def deduplicate_stops(self, stops: List[str]) -> List[str]:
         """중복 정류장 제거 (유사 이름 포함)"""
@@ -118,7 +208,7 @@ class StopExtractor:
 
         for stop in stops:
             # 정규화 (공백, 숫자 제거)
-            normalized = re.sub(r"[\s\d]", "", stop)
+            normalized = _dedup_key(stop)
 
             if normalized not in seen_normalized:
                 seen_normalized.add(normalized)
@@ -187,47 +277,48 @@ class StopExtractor:
         routes = []
 
         for result in ocr_results.get("results", []):
-            if not result.get("success"):
-                continue
+            self._process_one_result(result, routes)
 
-            full_text = result.get("full_text", "")
+        return routes
 
-            # 자치구별로 분리
-            district_blocks = self.split_by_district(full_text)
+    def _process_one_result(self, result: Dict, routes: List[Dict]):
+        """OCR 결과 1건(파일 1개)을 처리해 routes에 추가"""
+        if not result.get("success"):
+            return
 
-            for district, block_text in district_blocks.items():
-                route = self.parse_route_block(block_text, district)
-                if route["stops"]:  # 정류장이 있는 경우만
-                    route["source_file"] = result.get("filename")
-                    routes.append(route)
+        full_text = result.get("full_text", "")
 
-        return routes
+        # 자치구별로 분리
+        district_blocks = self.split_by_district(full_text)
+
+        for district, block_text in district_blocks.items():
+            route = self.parse_route_block(block_text, district)
+            if route["stops"]:  # 정류장이 있는 경우만
+                route["source_file"] = result.get("filename")
+                routes.append(route)
 
     def split_by_district(self, text: str) -> Dict[str, str]:
-        """텍스트를 자치구별로 분리"""
-        blocks = {}
-        current_district = None
-        current_lines = []
-
-        for line in text.split("\n"):
-            # 새 자치구 발견
-            for district in self.districts.keys():
-                if district in line:
-                    # 이전 블록 저장
-                    if current_district and current_lines:
-                        blocks[current_district] = "\n".join(current_lines)
-
-                    current_district = district
-                    current_lines = [line]
-                    break
+        """텍스트를 자치구별로 분리
+
+        자치구명이 나온 줄부터 다음 자치구명이 나온 줄 직전까지를 한 블록으로 봄
+        """
+        # 자치구명이 나온 줄의 시작 위치와 그 줄의 자치구
+        anchors = []
+        for match in _DISTRICT_SCAN.finditer(text):
+            district = match.group(1)
+            line_start = text.rfind("\n", 0, match.start()) + 1
+
+            if anchors and anchors[-1][0] == line_start:
+                if _DISTRICT_RANK[district] < _DISTRICT_RANK[anchors[-1][1]]:
+                    anchors[-1] = (line_start, district)
             else:
-                # 현재 블록에 추가
-                if current_district:
-                    current_lines.append(line)
+                anchors.append((line_start, district))
 
-        # 마지막 블록 저장
-        if current_district and current_lines:
-            blocks[current_district] = "\n".join(current_lines)
+        # 각 블록은 다음 블록 줄 앞의 줄바꿈 직전까지 (같은 자치구가 다시 나오면 덮어씀)
+        blocks = {}
+        ends = [start - 1 for start, _ in anchors[1:]] + [len(text)]
+        for (start, district), end in zip(anchors, ends):
+            blocks[district] = text[start:end]
 
         return blocks
 
@@ -237,28 +328,28 @@ class StopExtractor:
 
         # 메인 결과
         for result in crawl_results.get("main_results", []):
-            for route_data in result.get("routes", []):
-                route = self.parse_route_block(
-                    route_data.get("raw_text", ""),
-                    route_data.get("district")
-                )
-                if route["stops"]:
-                    route["source_url"] = route_data.get("source")
-                    routes.append(route)
+            self._process_crawl_result(result, routes, use_page_url=False)
 
         # 자치구 결과
         for result in crawl_results.get("district_results", []):
-            for route_data in result.get("routes", []):
-                route = self.parse_route_block(
-                    route_data.get("raw_text", ""),
-                    route_data.get("district")
-                )
-                if route["stops"]:
-                    route["source_url"] = result.get("url")
-                    routes.append(route)
+            self._process_crawl_result(result, routes, use_page_url=True)
 
         return routes
 
+    def _process_crawl_result(self, result: Dict, routes: List[Dict], use_page_url: bool):
+        """크롤링 결과 1건(페이지 1개)을 처리해 routes에 추가
+
+        use_page_url=True면 페이지 URL, 아니면 노선별 출처를 source_url로 사용
+        """
+        for route_data in result.get("routes", []):
+            route = self.parse_route_block(
+                route_data.get("raw_text", ""),
+                route_data.get("district")
+            )
+            if route["stops"]:
+                route["source_url"] = result.get("url") if use_page_url else route_data.get("source")
+                routes.append(route)
+
     def run(self) -> Dict:
         """전체 NLP 추출 실행"""
         logger.info("=" * 50)
@@ -267,44 +358,48 @@ class StopExtractor:
 
         all_routes = []
 
-        # OCR 결과 처리
+        # OCR 결과 처리 (파일 단위로 스트리밍해 한 건씩 처리)
         ocr_path = PROCESSED_DIR / "ocr_results.json"
         if ocr_path.exists():
             logger.info("OCR 결과 처리 중...")
-            with open(ocr_path, encoding="utf-8") as f:
-                ocr_data = json.load(f)
-            routes = self.process_ocr_results(ocr_data)
+            routes = []
+            for result in iter_json_items(ocr_path, "results.item"):
+                self._process_one_result(result, routes)
             all_routes.extend(routes)
             logger.info(f"  OCR에서 {len(routes)}개 노선 추출")
 
-        # 크롤링 결과 처리
-        crawl_path = PROCESSED_DIR.parent / "data" / "raw" / "crawl_results.json"
-        if crawl_path.exists():
+        # 크롤링 결과 처리 (메인 → 자치구 순으로 스트리밍)
+        crawl_path = find_artifact(RAW_DIR / "crawl_results.json")
+        if crawl_path:
             logger.info("크롤링 결과 처리 중...")
-            with open(crawl_path, encoding="utf-8") as f:
-                crawl_data = json.load(f)
-            routes = self.process_crawl_results(crawl_data)
+            routes = []
+            for result in iter_json_items(crawl_path, "main_results.item"):
+                self._process_crawl_result(result, routes, use_page_url=False)
+            for result in iter_json_items(crawl_path, "district_results.item"):
+                self._process_crawl_result(result, routes, use_page_url=True)
             all_routes.extend(routes)
             logger.info(f"  크롤링에서 {len(routes)}개 노선 추출")
 
-        # 자치구별 그룹화
-        by_district = defaultdict(list)
+        # 자치구별 노선 수 / 정류장 수 집계 (노선은 district 필드를 가진 평탄한 목록으로 저장)
+        by_district = Counter()
+        total_stops = 0
         for route in all_routes:
-            by_district[route["district"]].append(route)
+            by_district[route["district"]] += 1
+            total_stops += len(route["stops"])
 
         # 결과 저장
         output = {
             "total_routes": len(all_routes),
-            "districts": dict(by_district),
+            "routes": all_routes,
             "summary": {
                 "district_count": len(by_district),
-                "total_stops": sum(len(r["stops"]) for r in all_routes)
+                "total_stops": total_stops,
+                "by_district_count": dict(by_district)
             }
         }
 
         output_path = PROCESSED_DIR / "extracted_routes.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        dump_json(output, output_path)
 
         logger.info(f"\nNLP 추출 완료! 결과: {output_path}")
         logger.info(f"  총 노선: {output['total_routes']}개")
@@ -6,20 +6,28 @@
 """
 
 import os
-import json
+import hashlib
 import logging
+import multiprocessing.util
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
 from config import OCR_CONFIG, RAW_DIR, PROCESSED_DIR
+from jsonio import load_json, dump_json
 
 logger = logging.getLogger(__name__)
 
+# OCR 결과에 영향을 주는 설정 (바뀌면 캐시 키도 바뀜)
+_CACHE_SETTINGS = ("language", "dpi", "psm", "binarize", "adaptive_block_size", "adaptive_c")
+
 # 선택적 임포트 (설치 안 된 경우 처리)
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
     PDF2IMAGE_AVAILABLE = True
 except ImportError:
     PDF2IMAGE_AVAILABLE = False
@@ -37,6 +45,75 @@ except ImportError:
     TESSERACT_AVAILABLE = False
     logger.warning("pytesseract 미설치 - OCR 불가")
 
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+try:
+    import cv2
+    import numpy as np
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
+    logger.info("OpenCV 미설치 - 고정 임계값 이진화 사용")
+
+# 이진화 임계값과 조회표 (PIL point는 256개 값 조회표를 C 루프로 적용)
+_BINARY_THRESHOLD = 128
+_BINARY_LUT = [255 if x > _BINARY_THRESHOLD else 0 for x in range(256)]
+
+# 프로세스마다 하나씩 유지하는 페이지 OCR 스레드 풀 / 스레드별 tesserocr API
+# (PDF마다 새로 만들지 않으므로 언어 모델은 스레드당 한 번만 로드)
+_page_workers = OCR_CONFIG["page_workers"]
+_page_executor: Optional[ThreadPoolExecutor] = None
+_tess_local = threading.local()  # PyTessBaseAPI는 스레드 안전하지 않음
+_tess_apis = []  # 종료 시 End() 호출용
+_state_lock = threading.Lock()
+
+
+def _init_pdf_worker(page_workers: int):
+    """PDF 워커 프로세스 초기화 (페이지 OCR 스레드 풀을 미리 생성)"""
+    global _page_workers
+    _page_workers = page_workers
+    _get_page_executor()
+
+
+def _get_page_executor() -> ThreadPoolExecutor:
+    """현재 프로세스의 페이지 OCR 스레드 풀 (처음 호출할 때 생성)"""
+    global _page_executor
+    with _state_lock:
+        if _page_executor is None:
+            _page_executor = ThreadPoolExecutor(max_workers=_page_workers, thread_name_prefix="ocr-page")
+            # 프로세스 종료 시 정리 (atexit이 실행되지 않는 프로세스 풀 워커에서도 호출됨)
+            multiprocessing.util.Finalize(None, _shutdown_page_executor, exitpriority=10)
+        return _page_executor
+
+
+def _shutdown_page_executor():
+    """페이지 OCR 스레드 풀 종료 + tesserocr API 해제"""
+    global _page_executor
+    with _state_lock:
+        executor, _page_executor = _page_executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+
+    with _state_lock:
+        for api in _tess_apis:
+            api.End()
+        _tess_apis.clear()
+
+
+def _worker_counts(pdf_count: int) -> Tuple[int, int]:
+    """(PDF 프로세스 수, 프로세스당 페이지 스레드 수)
+
+    두 값의 곱이 CPU 코어 수를 넘지 않도록 제한 (PDF가 적으면 남는 코어를 페이지 스레드에 배분)
+    """
+    cpus = os.cpu_count() or 1
+    pdf_workers = max(1, min(OCR_CONFIG["max_workers"] or cpus, pdf_count, cpus))
+    page_workers = max(1, min(OCR_CONFIG["page_workers"], cpus // pdf_workers))
+    return pdf_workers, page_workers
+
 
 class PDFOCRParser:
     """PDF 문서 OCR 파서"""
@@ -45,6 +122,9 @@ class PDFOCRParser:
         self.dpi = OCR_CONFIG["dpi"]
         self.language = OCR_CONFIG["language"]
         self.results = []
+        # PDF 내용 해시 기준 OCR 결과 캐시
+        self.cache_enabled = OCR_CONFIG["cache_enabled"]
+        self.cache_dir = OCR_CONFIG["cache_dir"]
 
     def check_dependencies(self) -> Tuple[bool, List[str]]:
         """의존성 확인"""
@@ -55,8 +135,8 @@ class PDFOCRParser:
         if not TESSERACT_AVAILABLE:
             missing.append("pytesseract, Pillow")
 
-        # Tesseract 설치 확인
-        if TESSERACT_AVAILABLE:
+        # Tesseract 설치 확인 (tesserocr는 라이브러리를 직접 사용하므로 실행 파일 불필요)
+        if TESSERACT_AVAILABLE and not TESSEROCR_AVAILABLE:
             try:
                 pytesseract.get_tesseract_version()
             except Exception:
@@ -70,6 +150,11 @@ class PDFOCRParser:
         if image.mode != "L":
             image = image.convert("L")
 
+        # OpenCV가 있으면 조명이 고르지 않은 안내문에도 강한 적응형 / Otsu 이진화
+        method = OCR_CONFIG["binarize"]
+        if CV2_AVAILABLE and method in ("adaptive", "otsu"):
+            return self.binarize_cv2(image, method)
+
         # 대비 향상
         enhancer = ImageEnhance.Contrast(image)
         image = enhancer.enhance(2.0)
@@ -78,11 +163,27 @@ class PDFOCRParser:
         image = image.filter(ImageFilter.SHARPEN)
 
         # 이진화 (흑백)
-        threshold = 128
-        image = image.point(lambda x: 255 if x > threshold else 0, mode="1")
+        image = image.point(_BINARY_LUT, mode="1")
 
         return image
 
+    def binarize_cv2(self, image: "Image.Image", method: str) -> "Image.Image":
+        """OpenCV 이진화 (adaptive: 가우시안 적응형, otsu: Otsu 전역 임계값)"""
+        gray = np.asarray(image)
+
+        if method == "adaptive":
+            binary = cv2.adaptiveThreshold(
+                gray, 255,
+                cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+                cv2.THRESH_BINARY,
+                OCR_CONFIG["adaptive_block_size"],
+                OCR_CONFIG["adaptive_c"]
+            )
+        else:
+            _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+
+        return Image.fromarray(binary)
+
     def pdf_to_images(self, pdf_path: Path) -> List["Image.Image"]:
         """PDF를 이미지로 변환"""
         if not PDF2IMAGE_AVAILABLE:
@@ -101,6 +202,45 @@ class PDFOCRParser:
             logger.error(f"PDF 변환 실패: {e}")
             return []
 
+    def count_pages(self, pdf_path: Path) -> int:
+        """PDF 페이지 수 (실패 시 0)"""
+        if not PDF2IMAGE_AVAILABLE:
+            logger.error("pdf2image가 설치되지 않았습니다")
+            return 0
+
+        try:
+            return int(pdfinfo_from_path(str(pdf_path))["Pages"])
+        except Exception as e:
+            logger.error(f"PDF 정보 확인 실패: {e}")
+            return 0
+
+    def iter_pdf_pages(self, pdf_path: Path, page_count: int) -> Iterator["Image.Image"]:
+        """PDF를 한 페이지씩 이미지로 변환 (전체 페이지를 메모리에 올리지 않음)"""
+        for page_number in range(1, page_count + 1):
+            # 바깥 스레드/프로세스 풀과 겹치지 않도록 poppler는 단일 스레드로 실행
+            yield convert_from_path(
+                str(pdf_path),
+                dpi=self.dpi,
+                fmt="png",
+                first_page=page_number,
+                last_page=page_number,
+                thread_count=1
+            )[0]
+
+    def tesserocr_api(self) -> "tesserocr.PyTessBaseAPI":
+        """현재 스레드의 tesserocr API (언어 모델은 스레드당 한 번만 로드)"""
+        api = getattr(_tess_local, "api", None)
+        if api is None:
+            api = tesserocr.PyTessBaseAPI(
+                lang=self.language,
+                psm=OCR_CONFIG["psm"],
+                oem=tesserocr.OEM.DEFAULT
+            )
+            _tess_local.api = api
+            with _state_lock:
+                _tess_apis.append(api)
+        return api
+
     def extract_text_from_image(self, image: "Image.Image") -> str:
         """이미지에서 텍스트 추출"""
         if not TESSERACT_AVAILABLE:
@@ -111,6 +251,15 @@ class PDFOCRParser:
             # 이미지 전처리
             processed = self.preprocess_image(image.copy())
 
+            # tesserocr: 프로세스 안에서 Tesseract 실행 (페이지마다 실행 파일 / 모델 로드 없음)
+            if TESSEROCR_AVAILABLE:
+                api = self.tesserocr_api()
+                api.SetImage(processed)
+                return api.GetUTF8Text().strip()
+
+            # pytesseract는 임시 파일로 이미지를 넘기므로 PNG 압축 대신 무압축 PNM(PBM/PGM)으로 저장
+            processed.format = "PPM"
+
             # OCR 설정
             custom_config = f"--psm {OCR_CONFIG['psm']} --oem 3"
 
@@ -146,27 +295,50 @@ class PDFOCRParser:
             logger.error(result["error"])
             return result
 
-        # PDF → 이미지
-        images = self.pdf_to_images(pdf_path)
-        if not images:
+        # PDF 페이지 수 확인
+        page_count = self.count_pages(pdf_path)
+        if not page_count:
             result["error"] = "PDF 이미지 변환 실패"
             return result
 
-        # 각 페이지 OCR
+        logger.info(f"  PDF 페이지 수: {page_count}")
+
+        # 각 페이지 OCR (Tesseract 실행 중에는 GIL이 풀리므로 스레드로 병렬 처리)
+        def ocr_page(i: int, image: "Image.Image") -> str:
+            logger.info(f"  페이지 {i + 1}/{page_count} OCR 중...")
+            try:
+                return self.extract_text_from_image(image)
+            finally:
+                image.close()
+
+        # 변환은 한 페이지씩, 동시에 메모리에 있는 페이지는 스레드 수만큼으로 제한
+        # (스레드 풀은 프로세스에서 재사용하므로 PDF마다 만들지 않음)
+        executor = _get_page_executor()
         all_text = []
-        for i, image in enumerate(images):
-            logger.info(f"  페이지 {i + 1}/{len(images)} OCR 중...")
+        pending = deque()
+
+        try:
+            for i, image in enumerate(self.iter_pdf_pages(pdf_path, page_count)):
+                pending.append(executor.submit(ocr_page, i, image))
+                if len(pending) >= _page_workers:
+                    all_text.append(pending.popleft().result())
+        except Exception as e:
+            logger.error(f"PDF 변환 실패: {e}")
+            result["error"] = "PDF 이미지 변환 실패"
+            # 이미 제출한 페이지는 끝날 때까지 기다림 (이미지 해제)
+            for future in pending:
+                future.result()
+            return result
 
-            page_text = self.extract_text_from_image(image)
+        all_text.extend(future.result() for future in pending)
 
+        for i, page_text in enumerate(all_text):
             result["pages"].append({
                 "page_number": i + 1,
                 "text": page_text,
                 "char_count": len(page_text)
             })
 
-            all_text.append(page_text)
-
         result["full_text"] = "\n\n--- 페이지 구분 ---\n\n".join(all_text)
         result["success"] = True
         result["total_chars"] = len(result["full_text"])
@@ -201,21 +373,100 @@ class PDFOCRParser:
 
         return result
 
+    def cache_path(self, pdf_path: Path) -> Path:
+        """PDF의 OCR 캐시 파일 경로 (PDF 내용 + OCR 설정의 sha256)"""
+        digest = hashlib.sha256()
+        with open(pdf_path, "rb") as f:
+            # 큰 PDF도 메모리에 다 올리지 않도록 1MB씩 해시
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        digest.update(repr([OCR_CONFIG[key] for key in _CACHE_SETTINGS]).encode())
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+
+    def load_checkpoint(self, checkpoint_path: Path, file_keys: List) -> Dict[str, Dict]:
+        """중단된 실행의 중간 결과 로드 (PDF 목록이 그대로일 때만, 파일 경로 → 결과)"""
+        if not checkpoint_path.exists():
+            return {}
+
+        try:
+            checkpoint = load_json(checkpoint_path)
+        except Exception as e:
+            logger.warning(f"중간 결과 로드 실패: {e}")
+            return {}
+
+        if checkpoint.get("files") != file_keys:
+            return {}
+
+        return {result["filepath"]: result for result in checkpoint.get("results", [])}
+
     def parse_all_pdfs(self, directory: Path = RAW_DIR) -> List[Dict]:
-        """디렉토리 내 모든 PDF 파싱"""
-        results = []
+        """디렉토리 내 모든 PDF 파싱 (파일 단위로 프로세스 병렬 처리)
 
-        pdf_files = list(directory.glob("*.pdf"))
+        - 최근 수정된 PDF부터 처리
+        - 내용이 바뀌지 않은 PDF는 캐시된 결과를 쓰고 OCR을 건너뜀
+        - 파일마다 중간 결과를 저장해 중단 후 다시 실행하면 이어서 처리
+        """
+        pdf_files = sorted(directory.glob("*.pdf"), key=lambda p: p.stat().st_mtime, reverse=True)
         logger.info(f"발견된 PDF 파일: {len(pdf_files)}개")
 
-        for pdf_path in pdf_files:
-            result = self.parse_pdf(pdf_path)
-            results.append(result)
+        if not pdf_files:
+            return []
 
-            # 개별 결과 저장
-            output_path = PROCESSED_DIR / f"{pdf_path.stem}_ocr.json"
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, ensure_ascii=False, indent=2)
+        # 같은 PDF 목록(경로 + 수정 시각)일 때만 중간 결과를 이어서 사용
+        checkpoint_path = PROCESSED_DIR / "ocr_results.partial.json"
+        file_keys = [[str(pdf_path), pdf_path.stat().st_mtime_ns] for pdf_path in pdf_files]
+        resumed = self.load_checkpoint(checkpoint_path, file_keys)
+        if resumed:
+            logger.info(f"중간 결과에서 이어서 처리: {len(resumed)}개 완료됨")
+
+        results = [None] * len(pdf_files)
+        pending = []  # (결과 위치, PDF 경로, 캐시 경로)
+
+        for i, pdf_path in enumerate(pdf_files):
+            if str(pdf_path) in resumed:
+                results[i] = resumed[str(pdf_path)]
+                continue
+
+            cache_path = self.cache_path(pdf_path) if self.cache_enabled else None
+
+            if cache_path and cache_path.exists():
+                result = load_json(cache_path)
+                # 같은 내용이 다른 이름으로 저장된 경우를 위해 경로는 현재 파일 기준
+                result["filename"] = pdf_path.name
+                result["filepath"] = str(pdf_path)
+                results[i] = result
+            else:
+                pending.append((i, pdf_path, cache_path))
+
+        if self.cache_enabled:
+            logger.info(f"OCR 캐시 적중: {len(pdf_files) - len(pending) - len(resumed)}개")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        if pending:
+            pdf_workers, page_workers = _worker_counts(len(pending))
+            logger.info(f"OCR 병렬 처리: PDF {pdf_workers}개 프로세스 × 페이지 {page_workers}개 스레드")
+
+            with ProcessPoolExecutor(
+                max_workers=pdf_workers,
+                initializer=_init_pdf_worker,
+                initargs=(page_workers,)
+            ) as executor:
+                parsed = executor.map(
+                    _parse_pdf_worker,
+                    [pdf_path for _, pdf_path, _ in pending],
+                    [cache_path for _, _, cache_path in pending]
+                )
+                for (i, _, _), result in zip(pending, parsed):
+                    results[i] = result
+
+                    # 파일 하나 끝날 때마다 성공한 결과 저장 (실패한 파일은 다음 실행에서 재시도)
+                    dump_json({
+                        "files": file_keys,
+                        "results": [r for r in results if r is not None and r["success"]]
+                    }, checkpoint_path, indent=False)
+
+        # 전체 완료 후에는 중간 결과 불필요
+        checkpoint_path.unlink(missing_ok=True)
 
         return results
 
@@ -252,8 +503,7 @@ class PDFOCRParser:
         }
 
         output_path = PROCESSED_DIR / "ocr_results.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        dump_json(output, output_path)
 
         logger.info(f"\nOCR 완료! 결과: {output_path}")
         logger.info(f"  성공: {output['successful']}개, 실패: {output['failed']}개")
@@ -261,6 +511,20 @@ class PDFOCRParser:
         return output
 
 
+def _parse_pdf_worker(pdf_path: Path, cache_path: Optional[Path] = None) -> Dict:
+    """워커 프로세스에서 PDF 하나 파싱 후 개별 결과 저장 (성공한 결과는 캐시에도 저장)"""
+    result = PDFOCRParser().parse_pdf(pdf_path)
+
+    # 개별 결과 저장
+    output_path = PROCESSED_DIR / f"{pdf_path.stem}_ocr.json"
+    dump_json(result, output_path)
+
+    if cache_path and result["success"]:
+        dump_json(result, cache_path, indent=False)
+
+    return result
+
+
 if __name__ == "__main__":
     logging.basicConfig(
         level=logging.INFO,
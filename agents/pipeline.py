@@ -6,7 +6,6 @@
 - 진행 상황 리포팅
 """
 
-import json
 import logging
 import time
 from pathlib import Path
@@ -15,7 +14,8 @@ from datetime import datetime
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
-from config import RAW_DIR, PROCESSED_DIR, LOGS_DIR
+from config import RAW_DIR, PROCESSED_DIR, LOGS_DIR, OUTPUT_CONFIG
+from jsonio import dump_json
 
 from .crawler import DistrictCrawler
 from .ocr_parser import PDFOCRParser
@@ -166,9 +166,9 @@ class PipelineOrchestrator:
         }
 
         # 리포트 저장
+        # 스테이지 결과에 섞인 Path 등은 문자열로 기록
         report_path = PROCESSED_DIR / "pipeline_report.json"
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        dump_json(report, report_path, default=str)
 
         # 최종 로그
         logger.info("\n" + "=" * 70)
@@ -233,9 +233,17 @@ def main():
         action="store_true",
         help="오류 발생 시 중단"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="중간 산출물과 서비스용 JSON을 들여쓴 JSON으로 저장 (디버깅용, 기본: 압축)"
+    )
 
     args = parser.parse_args()
 
+    if args.pretty:
+        OUTPUT_CONFIG["pretty"] = True
+
     # 로깅 설정
     logging.basicConfig(
         level=logging.INFO,
@@ -6,47 +6,117 @@
 - 최종 서비스용 JSON 생성
 """
 
-import json
+import math
 import logging
+import numpy as np
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent))
-from config import SCHEMA_VERSION, PROCESSED_DIR, SEOUL_DISTRICTS
+from config import SCHEMA_VERSION, PROCESSED_DIR, SEOUL_DISTRICTS, OUTPUT_CONFIG
+from jsonio import load_json, dump_json
 
 logger = logging.getLogger(__name__)
 
 
+# 서울시 경계 좌표 (대략적 / 좌표 검사마다 dict 조회하지 않도록 모듈 상수로 둠)
+_MIN_LAT, _MAX_LAT = 37.42, 37.72
+_MIN_LNG, _MAX_LNG = 126.76, 127.18
+
+# 그대로 float 배열로 변환 가능한 좌표 타입 (bool, None, 문자열 등은 개별 변환)
+_PLAIN_NUMBER_TYPES = {int, float}
+
+
+def _coord_value(value) -> float:
+    """배열 비교용 좌표값 (숫자가 아니면 항상 범위를 벗어나는 inf)"""
+    return value if isinstance(value, (int, float)) else math.inf
+
+
+def _coord_column(values: List[Any]) -> np.ndarray:
+    """좌표값 목록 → float64 배열 (지오코딩 결과처럼 모두 숫자면 한 번에 변환)"""
+    if set(map(type, values)) <= _PLAIN_NUMBER_TYPES:
+        return np.array(values, dtype=np.float64)
+    return np.fromiter(map(_coord_value, values), dtype=np.float64, count=len(values))
+
+
+# 서비스용 JSON의 노선 / 자치구 키 구성 (이 순서 그대로인 입력은 복사 없이 재사용)
+_ROUTE_KEYS = ("name", "hours", "interval", "stops")
+_DISTRICT_KEYS = ("district", "routes")
+
+
+def _is_final_route(route: Dict) -> bool:
+    """노선 dict가 이미 서비스용 JSON 형식인지 (필수 키만 순서대로 가짐)"""
+    return tuple(route) == _ROUTE_KEYS
+
+
+def _in_bounds(lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """좌표 배열이 서울 범위 안인지 (validate_coordinates처럼 "범위 초과가 아님"으로 판정 / NaN 처리도 동일)"""
+    return ~(
+        (lats < _MIN_LAT) | (lats > _MAX_LAT)
+        | (lngs < _MIN_LNG) | (lngs > _MAX_LNG)
+    )
+
+
 class JSONValidator:
     """JSON 데이터 검증 및 최종 출력 생성"""
 
     def __init__(self):
         # 서울시 경계 좌표 (대략적)
         self.seoul_bounds = {
-            "min_lat": 37.42,
-            "max_lat": 37.72,
-            "min_lng": 126.76,
-            "max_lng": 127.18
+            "min_lat": _MIN_LAT,
+            "max_lat": _MAX_LAT,
+            "min_lng": _MIN_LNG,
+            "max_lng": _MAX_LNG
         }
 
         self.validation_errors = []
         self.validation_warnings = []
 
+        # 입력 / 출력 경로 (run 호출마다 다시 계산하지 않음)
+        self._input_path = PROCESSED_DIR / "geocoded_routes.json"
+        self._final_path = PROCESSED_DIR.parent / "shuttle_routes.json"
+        self._report_path = PROCESSED_DIR / "validation_report.json"
+
     def validate_coordinates(self, lat: float, lng: float) -> Tuple[bool, str]:
         """좌표 유효성 검사"""
         if not isinstance(lat, (int, float)) or not isinstance(lng, (int, float)):
             return False, "좌표가 숫자가 아님"
 
-        if lat < self.seoul_bounds["min_lat"] or lat > self.seoul_bounds["max_lat"]:
+        if lat < _MIN_LAT or lat > _MAX_LAT:
             return False, f"위도 범위 초과: {lat}"
 
-        if lng < self.seoul_bounds["min_lng"] or lng > self.seoul_bounds["max_lng"]:
+        if lng < _MIN_LNG or lng > _MAX_LNG:
             return False, f"경도 범위 초과: {lng}"
 
         return True, "OK"
 
+    def valid_coords_mask(self, stops: List[Dict]) -> np.ndarray:
+        """정류장 목록의 좌표 유효 여부를 한 번에 계산 (validate_coordinates와 같은 기준)
+
+        숫자가 아니거나 없는 좌표는 inf로 바꿔 범위 밖으로 처리
+        """
+        lats = _coord_column([stop.get("lat") for stop in stops])
+        lngs = _coord_column([stop.get("lng") for stop in stops])
+        return _in_bounds(lats, lngs)
+
+    def coords_fix_codes(self, stops: List[Dict]) -> List[int]:
+        """정류장별 좌표 처리 방법 (1: 유지, 2: 위도/경도 뒤바뀜 → 교환 후 유지, 0: 제외)
+
+        서울 범위에서는 위도(37.x)와 경도(126~127.x) 구간이 겹치지 않으므로
+        (lat, lng)는 범위 밖인데 (lng, lat)이 범위 안이면 수집 과정에서 순서가 바뀐 좌표로 판단
+        """
+        lats = _coord_column([stop.get("lat") for stop in stops])
+        lngs = _coord_column([stop.get("lng") for stop in stops])
+
+        normal = _in_bounds(lats, lngs)
+        # 교환은 두 값이 모두 유한한 숫자일 때만 (NaN 좌표를 새로 살리지 않음)
+        swapped = np.isfinite(lats) & np.isfinite(lngs) & _in_bounds(lngs, lats)
+        return np.where(normal, 1, np.where(swapped, 2, 0)).tolist()
+
     def validate_stop(self, stop: Dict, route_name: str) -> List[str]:
         """정류장 데이터 검증"""
         errors = []
@@ -66,8 +136,13 @@ class JSONValidator:
 
         return errors
 
-    def validate_route(self, route: Dict, district: str) -> Tuple[List[str], List[str]]:
-        """노선 데이터 검증"""
+    def validate_route(
+        self, route: Dict, district: str, coords_ok: Optional[Iterator[bool]] = None
+    ) -> Tuple[List[str], List[str]]:
+        """노선 데이터 검증
+
+        coords_ok: 미리 계산한 정류장별 좌표 유효 여부 (이 노선의 정류장 수만큼 소비)
+        """
         errors = []
         warnings = []
 
@@ -82,9 +157,15 @@ class JSONValidator:
         if len(stops) < 2:
             warnings.append(f"[{route_name}] 정류장이 2개 미만")
 
-        for stop in stops:
-            stop_errors = self.validate_stop(stop, route_name)
-            errors.extend(stop_errors)
+        # 좌표가 유효하고 이름이 있는 정류장은 건너뛰고, 문제가 있는 정류장만 상세 검증
+        if coords_ok is None:
+            coords_ok = iter(self.valid_coords_mask(stops).tolist())
+
+        # zip은 stops가 끝나면 coords_ok를 더 소비하지 않음
+        for stop, ok in zip(stops, coords_ok):
+            if ok and stop.get("name"):
+                continue
+            errors.extend(self.validate_stop(stop, route_name))
 
         # 선택 필드 검증
         if not route.get("hours"):
@@ -113,10 +194,15 @@ class JSONValidator:
         if not routes:
             warnings.append(f"[{district}] 노선 정보 없음")
 
+        # 자치구 전체 정류장 좌표를 한 번에 검사한 뒤 노선 순서대로 나눠 소비
+        coords_ok = iter(self.valid_coords_mask(
+            [stop for route in routes for stop in route.get("stops", [])]
+        ).tolist())
+
         for route in routes:
-            route_errors, route_warnings = self.validate_route(route, district)
-            errors.extend(route_errors)
-            warnings.extend(route_warnings)
+            route_errors, route_warnings = self.validate_route(route, district, coords_ok)
+            errors += route_errors
+            warnings += route_warnings
 
         return errors, warnings
 
@@ -133,8 +219,8 @@ class JSONValidator:
 
         for district_data in districts:
             errors, warnings = self.validate_district(district_data)
-            self.validation_errors.extend(errors)
-            self.validation_warnings.extend(warnings)
+            self.validation_errors += errors
+            self.validation_warnings += warnings
 
         return self.get_validation_result()
 
@@ -149,91 +235,122 @@ class JSONValidator:
         }
 
     def fix_common_issues(self, data: Dict) -> Dict:
-        """일반적인 문제 자동 수정"""
+        """일반적인 문제 자동 수정
+
+        입력은 수정하지 않고, 바뀌는 노선 / 자치구만 새 dict로 만들어 반환
+        """
+        # 전체 정류장 좌표를 한 번에 검사 (좌표 0은 범위 밖이므로 값 없음과 같이 제외됨)
+        all_stops = [
+            stop
+            for district_data in data.get("districts", [])
+            for route in district_data.get("routes", [])
+            for stop in route.get("stops", [])
+        ]
+        codes = iter(self.coords_fix_codes(all_stops))
+        swapped_count = 0
+
         fixed_districts = []
 
         for district_data in data.get("districts", []):
             fixed_routes = []
 
             for route in district_data.get("routes", []):
-                # 유효한 정류장만 유지
+                # 유효한 정류장만 유지 (버려지는 노선도 코드는 순서대로 소비)
                 valid_stops = []
                 for stop in route.get("stops", []):
-                    lat = stop.get("lat")
-                    lng = stop.get("lng")
-
-                    if lat and lng:
-                        valid, _ = self.validate_coordinates(lat, lng)
-                        if valid:
-                            valid_stops.append(stop)
+                    code = next(codes)
+                    if code == 1:
+                        valid_stops.append(stop)
+                    elif code == 2:
+                        valid_stops.append({**stop, "lat": stop["lng"], "lng": stop["lat"]})
+                        swapped_count += 1
 
                 if len(valid_stops) >= 2:
-                    route["stops"] = valid_stops
-                    fixed_routes.append(route)
+                    fixed_routes.append({**route, "stops": valid_stops})
 
             if fixed_routes:
-                district_data["routes"] = fixed_routes
-                fixed_districts.append(district_data)
+                fixed_districts.append({**district_data, "routes": fixed_routes})
+
+        if swapped_count:
+            logger.info(f"  위도/경도 교환: {swapped_count}개 정류장")
+
+        return {**data, "districts": fixed_districts}
 
-        data["districts"] = fixed_districts
-        return data
+    def generate_final_json(
+        self, data: Dict, source: str = "자동 수집", now: Optional[datetime] = None
+    ) -> Dict:
+        """최종 서비스용 JSON 생성
+
+        now: 갱신 일자로 쓸 시각 (없으면 현재 시각)
+        """
+        if now is None:
+            now = datetime.now()
 
-    def generate_final_json(self, data: Dict, source: str = "자동 수집") -> Dict:
-        """최종 서비스용 JSON 생성"""
         final = {
-            "updated_at": datetime.now().strftime("%Y-%m-%d"),
+            "updated_at": now.strftime("%Y-%m-%d"),
             "source": source,
             "schema_version": SCHEMA_VERSION,
             "districts": []
         }
 
         for district_data in data.get("districts", []):
-            district_entry = {
-                "district": district_data["district"],
-                "routes": []
-            }
-
-            for route in district_data.get("routes", []):
-                route_entry = {
-                    "name": route.get("name", f"{district_data['district']} 셔틀"),
-                    "hours": route.get("hours", "정보 없음"),
-                    "interval": route.get("interval", "정보 없음"),
-                    "stops": route.get("stops", [])
-                }
-                district_entry["routes"].append(route_entry)
-
-            if district_entry["routes"]:
-                final["districts"].append(district_entry)
+            district = district_data["district"]
+            routes = district_data.get("routes", [])
+
+            # 이미 출력 스키마와 같은 키 구성(같은 순서)인 노선은 새로 만들지 않고 그대로 사용
+            # (기본 노선 이름은 이름이 없을 때만 만든다)
+            if not all(map(_is_final_route, routes)):
+                routes = [
+                    route if _is_final_route(route) else {
+                        "name": route["name"] if "name" in route else f"{district} 셔틀",
+                        "hours": route.get("hours", "정보 없음"),
+                        "interval": route.get("interval", "정보 없음"),
+                        "stops": route.get("stops", [])
+                    }
+                    for route in routes
+                ]
+
+            if not routes:
+                continue
+
+            # 자치구도 노선 목록을 그대로 쓰고 키 구성이 같으면 입력 dict를 재사용
+            if tuple(district_data) == _DISTRICT_KEYS and routes is district_data["routes"]:
+                final["districts"].append(district_data)
+            else:
+                final["districts"].append({"district": district, "routes": routes})
 
         # 자치구 정렬 (가나다순)
-        final["districts"].sort(key=lambda x: x["district"])
+        final["districts"].sort(key=itemgetter("district"))
 
         return final
 
     def calculate_quality_score(self, data: Dict) -> Dict:
         """데이터 품질 점수 계산"""
-        total_districts = len(data.get("districts", []))
-        total_routes = sum(len(d.get("routes", [])) for d in data.get("districts", []))
-        total_stops = sum(
-            len(r.get("stops", []))
-            for d in data.get("districts", [])
-            for r in d.get("routes", [])
-        )
+        districts = data.get("districts", [])
+        total_districts = len(districts)
+
+        # 노선 / 정류장 수와 정보 보유 노선 수를 한 번의 순회로 집계
+        # (자치구별 노선은 chain으로 펼쳐 중첩 루프 없이 순회)
+        total_routes = 0
+        total_stops = 0
+        has_hours = 0
+        has_interval = 0
+
+        for r in chain.from_iterable(d.get("routes", ()) for d in districts):
+            total_routes += 1
+            total_stops += len(r.get("stops", ()))
+
+            hours = r.get("hours")
+            if hours and hours != "정보 없음":
+                has_hours += 1
+
+            interval = r.get("interval")
+            if interval and interval != "정보 없음":
+                has_interval += 1
 
         # 점수 계산
         district_coverage = min(total_districts / 25 * 100, 100)  # 25개 자치구
 
-        has_hours = sum(
-            1 for d in data.get("districts", [])
-            for r in d.get("routes", [])
-            if r.get("hours") and r.get("hours") != "정보 없음"
-        )
-        has_interval = sum(
-            1 for d in data.get("districts", [])
-            for r in d.get("routes", [])
-            if r.get("interval") and r.get("interval") != "정보 없음"
-        )
-
         info_completeness = 0
         if total_routes > 0:
             info_completeness = ((has_hours + has_interval) / (total_routes * 2)) * 100
@@ -256,14 +373,16 @@ class JSONValidator:
         logger.info("에이전트 5: JSON 검증기 시작")
         logger.info("=" * 50)
 
+        # 서비스용 JSON과 리포트가 같은 시각을 쓰도록 한 번만 조회
+        now = datetime.now()
+
         # 입력 데이터 로드
-        input_path = PROCESSED_DIR / "geocoded_routes.json"
+        input_path = self._input_path
         if not input_path.exists():
             logger.error(f"입력 파일 없음: {input_path}")
             return {"error": "Input file not found"}
 
-        with open(input_path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json(input_path)
 
         # 검증
         logger.info("데이터 검증 중...")
@@ -287,7 +406,7 @@ class JSONValidator:
 
         # 최종 JSON 생성
         logger.info("\n최종 JSON 생성 중...")
-        final_data = self.generate_final_json(data)
+        final_data = self.generate_final_json(data, now=now)
 
         # 품질 점수
         quality = self.calculate_quality_score(final_data)
@@ -296,20 +415,18 @@ class JSONValidator:
         logger.info(f"  정보 완성도: {quality['info_completeness']}%")
         logger.info(f"  종합 점수: {quality['overall_score']}점")
 
-        # 결과 저장
-        output_path = PROCESSED_DIR.parent / "shuttle_routes.json"
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(final_data, f, ensure_ascii=False, indent=2)
+        # 결과 저장 (웹 페이지가 읽는 파일이므로 기본은 공백 없는 압축 JSON, 리포트는 사람이 읽으므로 들여씀)
+        output_path = self._final_path
+        dump_json(final_data, output_path, indent=OUTPUT_CONFIG["pretty"])
 
         # 검증 리포트 저장
         report = {
             "validation": validation,
             "quality": quality,
-            "generated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            "generated_at": now.strftime("%Y-%m-%d %H:%M:%S")
         }
-        report_path = PROCESSED_DIR / "validation_report.json"
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
+        report_path = self._report_path
+        dump_json(report, report_path)
 
         logger.info(f"\n✅ 완료!")
         logger.info(f"  서비스용 JSON: {output_path}")
@@ -4,12 +4,16 @@
 - HTML 기반 공지 자동 수집 → JSON 변환
 """
 
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+import lxml.html
+from lxml import etree
 import json
 import re
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+from config import SEOUL_DISTRICTS_SET
 
 # 수집 대상 URL 목록
 SOURCES = [
@@ -21,66 +25,122 @@ SOURCES = [
     # 추가 소스는 여기에 등록
 ]
 
-def fetch_page(url: str) -> str:
-    """웹 페이지 HTML 가져오기"""
+# 자치구 이름 후보 (예: 영등포구, 관악구 등)
+_DISTRICT_RE = re.compile(r"([가-힣]{1,3}구)")
+
+# 운행 시간 (예: 07:30 ~ 09:30)
+_TIME_RE = re.compile(r"(\d{1,2}:\d{2})\s*[~-]\s*(\d{1,2}:\d{2})")
+
+# 배차간격 (예: 5~10분, 15분)
+# 숫자는 연속된 숫자 전체로만 매칭해 긴 숫자/공백 열에서도 백트래킹이 폭증하지 않음
+_INTERVAL_RE = re.compile(r"(?<!\d)(\d+)(?!\d)\s*(?:[~-]\s*)?(?:(\d+)(?!\d)\s*)?분")
+
+# 본문 영역 (div.view-con, div.content, article, .post-content / 문서 순서로 반환)
+_CONTENT_AREAS = etree.XPath("|".join([
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' view-con ')]",
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' content ')]",
+    "//article",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')]",
+]))
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+async def fetch_page(session: aiohttp.ClientSession, url: str) -> bytes:
+    """웹 페이지 HTML 본문(바이트) 가져오기
+
+    디코딩은 파서에 맡김 (XML 선언이 있는 XHTML도 그대로 파싱되도록)
+    """
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
-        res = requests.get(url, headers=headers, timeout=10)
-        res.encoding = "utf-8"
-        return res.text
+        async with session.get(url) as res:
+            return await res.read()
     except Exception as e:
         print(f"❌ 페이지 로드 실패: {url} - {e}")
-        return ""
+        return b""
 
-def extract_district_info(soup: BeautifulSoup, source_url: str) -> List[Dict]:
+def parse_html(html: bytes) -> Optional[lxml.html.HtmlElement]:
+    """HTML 본문을 UTF-8로 파싱 (스크립트/스타일 제거, 빈 문서나 파싱 불가 문서면 None)"""
+    # 파서는 스레드 간에 공유하지 않도록 호출마다 생성
+    parser = lxml.html.HTMLParser(encoding="utf-8")
+    try:
+        tree = lxml.html.document_fromstring(html, parser=parser)
+    except etree.ParserError:
+        return None
+    except ValueError as e:
+        # 파싱할 수 없는 문서는 건너뛰고 나머지 소스 수집은 계속
+        print(f"❌ HTML 파싱 실패: {e}")
+        return None
+
+    # 본문 텍스트에 섞이지 않도록 스크립트/스타일 제거
+    etree.strip_elements(tree, "script", "style", "template", with_tail=False)
+    return tree
+
+def element_text(element: lxml.html.HtmlElement) -> str:
+    """요소의 텍스트 조각을 앞뒤 공백 제거 후 줄바꿈으로 연결"""
+    return "\n".join(piece for piece in map(str.strip, element.itertext()) if piece)
+
+def extract_district_info(tree: lxml.html.HtmlElement, source_url: str) -> List[Dict]:
     """HTML에서 자치구별 셔틀버스 정보 추출"""
     districts = []
 
     # 본문 영역 선택 (사이트마다 구조가 다를 수 있음)
-    content_areas = soup.select("div.view-con, div.content, article, .post-content")
+    content_areas = _CONTENT_AREAS(tree)
 
     if not content_areas:
-        content_areas = [soup.body] if soup.body else []
+        body = tree.find("body")
+        content_areas = [body] if body is not None else []
 
     for section in content_areas:
-        text = section.get_text("\n", strip=True)
+        text = element_text(section)
 
         # 자치구 이름 추출 (예: 영등포구, 관악구 등)
-        district_matches = re.findall(r"([가-힣]{1,3}구)", text)
-
-        # 서울시 자치구 목록으로 필터링
-        seoul_districts = [
-            "종로구", "중구", "용산구", "성동구", "광진구", "동대문구", "중랑구",
-            "성북구", "강북구", "도봉구", "노원구", "은평구", "서대문구", "마포구",
-            "양천구", "강서구", "구로구", "금천구", "영등포구", "동작구", "관악구",
-            "서초구", "강남구", "송파구", "강동구"
-        ]
-
-        found_districts = [d for d in district_matches if d in seoul_districts]
-        found_districts = list(dict.fromkeys(found_districts))  # 중복 제거
-
-        for district_name in found_districts:
-            routes = []
-
-            # 해당 구 관련 노선 정보 추출
-            for line in text.split("\n"):
-                if district_name in line or "운행" in line or "노선" in line or "셔틀" in line:
-                    # 시간 정보 추출
-                    time_match = re.search(r"(\d{1,2}:\d{2})\s*[~-]\s*(\d{1,2}:\d{2})", line)
-                    # 배차간격 추출
-                    interval_match = re.search(r"(\d+)\s*[~-]?\s*(\d+)?\s*분", line)
-
-                    route_info = {
-                        "raw_text": line.strip(),
-                        "hours": f"{time_match.group(1)}~{time_match.group(2)}" if time_match else None,
-                        "interval": f"{interval_match.group(1)}~{interval_match.group(2)}분" if interval_match and interval_match.group(2) else f"{interval_match.group(1)}분" if interval_match else None
-                    }
-
-                    if route_info["raw_text"]:
-                        routes.append(route_info)
+        district_matches = _DISTRICT_RE.findall(text)
+
+        # 서울시 자치구 목록으로 필터링 (순서 유지하며 중복 제거를 한 번의 순회로)
+        # 이미 본 이름은 서울시 여부와 관계없이 바로 건너뜀
+        seen = set()
+        found_districts = []
+        for d in district_matches:
+            if d not in seen:
+                seen.add(d)
+                if d in SEOUL_DISTRICTS_SET:
+                    found_districts.append(d)
+        if not found_districts:
+            continue
 
+        # 줄을 한 번만 훑으며 각 줄을 관련 자치구에 배정
+        # (운행/노선/셔틀 줄은 모든 자치구, 그 외에는 줄에 이름이 나온 자치구)
+        district_routes = {district_name: [] for district_name in found_districts}
+
+        for line in text.split("\n"):
+            raw_text = line.strip()
+            if not raw_text:
+                continue
+
+            if "운행" in line or "노선" in line or "셔틀" in line:
+                targets = found_districts
+            else:
+                targets = [d for d in found_districts if d in line]
+                if not targets:
+                    continue
+
+            # 시간 정보 추출
+            time_match = _TIME_RE.search(line)
+            # 배차간격 추출
+            interval_match = _INTERVAL_RE.search(line)
+
+            # 같은 줄은 배정된 자치구들이 같은 dict를 공유
+            route_info = {
+                "raw_text": raw_text,
+                "hours": f"{time_match.group(1)}~{time_match.group(2)}" if time_match else None,
+                "interval": f"{interval_match.group(1)}~{interval_match.group(2)}분" if interval_match and interval_match.group(2) else f"{interval_match.group(1)}분" if interval_match else None
+            }
+
+            for district_name in targets:
+                district_routes[district_name].append(route_info)
+
+        for district_name, routes in district_routes.items():
             if routes:
                 districts.append({
                     "district": district_name,
@@ -90,26 +150,30 @@ def extract_district_info(soup: BeautifulSoup, source_url: str) -> List[Dict]:
 
     return districts
 
-def collect_all_sources() -> Dict[str, Any]:
-    """모든 소스에서 데이터 수집"""
-    all_data = {
-        "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "sources": [],
-        "districts": []
-    }
-
-    seen_districts = set()
+def parse_source(html: bytes, source_url: str) -> List[Dict]:
+    """HTML 파싱 + 자치구 정보 추출 (파싱 불가 문서는 빈 목록)"""
+    tree = parse_html(html)
+    return extract_district_info(tree, source_url) if tree is not None else []
 
+async def _collect_async(all_data: Dict[str, Any]) -> Dict[str, Any]:
+    """모든 소스를 동시에 가져와 파싱 (결과는 SOURCES 순서대로 병합)"""
     for source in SOURCES:
         print(f"📡 수집 중: {source['name']} ({source['url']})")
 
-        html = fetch_page(source["url"])
-        if not html:
-            continue
+    # 전체 대기 시간이 소스별 응답 시간의 합이 아니라 가장 느린 응답 시간이 되도록 동시 요청
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        htmls = await asyncio.gather(*(fetch_page(session, source["url"]) for source in SOURCES))
 
-        soup = BeautifulSoup(html, "lxml")
-        districts = extract_district_info(soup, source["url"])
+    # 파싱은 CPU 작업이므로 스레드에서 실행 (lxml은 파싱 중 GIL을 놓음)
+    fetched = [(source, html) for source, html in zip(SOURCES, htmls) if html]
+    parsed = await asyncio.gather(
+        *(asyncio.to_thread(parse_source, html, source["url"]) for source, html in fetched)
+    )
 
+    seen_districts = set()
+
+    for (source, _), districts in zip(fetched, parsed):
         all_data["sources"].append({
             "name": source["name"],
             "url": source["url"],
@@ -124,6 +188,16 @@ def collect_all_sources() -> Dict[str, Any]:
 
     return all_data
 
+def collect_all_sources() -> Dict[str, Any]:
+    """모든 소스에서 데이터 수집"""
+    all_data = {
+        "collected_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "sources": [],
+        "districts": []
+    }
+
+    return asyncio.run(_collect_async(all_data))
+
 def save_raw_data(data: Dict, filename: str = "shuttle_routes_raw.json"):
     """수집된 원본 데이터 저장"""
     with open(filename, "w", encoding="utf-8") as f:
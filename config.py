@@ -23,6 +23,13 @@ CRAWL_CONFIG = {
     "timeout": 15,
     "retry_count": 3,
     "retry_delay": 2,
+    "concurrency": 4,  # 호스트당 동시 요청 수
+    "keepalive_timeout": 30,  # 유휴 연결 유지 시간 (초)
+    "download_concurrency": 8,  # 첨부파일 동시 다운로드 수
+    "chunk_size": 64 * 1024,  # 다운로드 청크 크기 (bytes)
+    "cache_enabled": True,  # ETag / Last-Modified 조건부 요청
+    "cache_file": RAW_DIR / ".http_cache.json",
+    "cache_dir": RAW_DIR / ".http_cache",  # 페이지 본문 (내용 해시 파일명)
 }
 
 # 서울시 공식 소스
@@ -68,12 +75,22 @@ SEOUL_DISTRICTS = {
     "강동구": {"code": "134", "keywords": ["강동", "천호", "길동"]},
 }
 
+# 자치구명 집합 (멤버십 검사용)
+SEOUL_DISTRICTS_SET = frozenset(SEOUL_DISTRICTS)
+
 # OCR 설정
 OCR_CONFIG = {
     "tesseract_path": r"C:\Program Files\Tesseract-OCR\tesseract.exe",  # Windows
     "language": "kor+eng",
     "dpi": 300,
     "psm": 6,  # Page segmentation mode
+    "binarize": "adaptive",  # adaptive / otsu (OpenCV 필요), fixed (임계값 128)
+    "adaptive_block_size": 31,  # 적응형 이진화 주변 영역 크기 (홀수)
+    "adaptive_c": 10,  # 적응형 이진화 보정 상수
+    "max_workers": None,  # PDF 파일 단위 병렬 프로세스 수 (None이면 CPU 코어 수)
+    "page_workers": 4,  # 파일 내 페이지 OCR 스레드 수 (프로세스 수 × 스레드 수는 CPU 코어 수 이내로 제한)
+    "cache_enabled": True,  # 내용이 같은 PDF는 OCR 결과 재사용
+    "cache_dir": PROCESSED_DIR / "ocr_cache",  # PDF 해시 파일명으로 결과 저장
 }
 
 # NLP 정류장 추출 패턴
@@ -94,7 +111,17 @@ GEOCODE_CONFIG = {
     "provider": "kakao",  # kakao, naver, google
     "default_region": "서울",
     "cache_enabled": True,
-    "cache_file": PROCESSED_DIR / "geocode_cache.json"
+    "cache_file": PROCESSED_DIR / "geocode_cache.json",
+    "concurrency": 10,  # 동시 API 요청 수
+    "keepalive_timeout": 30,  # 유휴 연결 유지 시간 (초)
+    "rate_limit": 30,  # 초당 최대 API 호출 수
+}
+
+# 산출물 저장 설정
+OUTPUT_CONFIG = {
+    # True면 중간 산출물을 들여쓴 .json으로 저장 (기본: 압축 .json.gz)
+    # 서비스용 shuttle_routes.json도 True일 때만 들여씀 (기본: 공백 없는 .json)
+    "pretty": False,
 }
 
 # JSON 스키마 버전
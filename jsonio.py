@@ -0,0 +1,110 @@
+"""
+JSON 파일 입출력 유틸리티
+- orjson 설치 시 C 확장으로 빠르게 직렬화/역직렬화
+- 미설치 시 표준 json 모듈로 동일한 형식 출력
+- 기계 전용 산출물은 압축 JSON + gzip(.json.gz)으로 저장
+- ijson 설치 시 큰 결과 파일의 배열 항목을 스트리밍으로 읽음
+"""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+# 선택적 임포트 (설치 안 된 경우 표준 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# 속도 위주 gzip 압축 수준 (JSON은 낮은 수준에서도 충분히 줄어듦)
+GZIP_LEVEL = 3
+
+
+def load_json(path: Path) -> Any:
+    """JSON 파일 로드"""
+    data = Path(path).read_bytes()
+    if str(path).endswith(".gz"):
+        data = gzip.decompress(data)
+
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def dump_json(data: Any, path: Path, indent: bool = True, default: Optional[Callable] = None):
+    """JSON 파일 저장 (한글은 이스케이프 없이 UTF-8로 기록)
+
+    indent=False면 공백 없이 압축 저장 (기계 전용 파일용)
+    경로가 .gz로 끝나면 gzip으로 압축해 저장
+    default: JSON 타입이 아닌 값(Path 등) 변환 함수
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(data, default=default, option=option)
+    elif indent:
+        payload = json.dumps(data, ensure_ascii=False, indent=2, default=default).encode("utf-8")
+    else:
+        payload = json.dumps(
+            data, ensure_ascii=False, separators=(",", ":"), default=default
+        ).encode("utf-8")
+
+    if str(path).endswith(".gz"):
+        payload = gzip.compress(payload, compresslevel=GZIP_LEVEL)
+    Path(path).write_bytes(payload)
+
+
+def iter_json_items(path: Path, prefix: str) -> Iterator[Any]:
+    """JSON 파일에서 prefix 위치 배열의 항목을 하나씩 반환
+
+    prefix는 ijson 형식 (예: "results.item")
+    ijson이 있으면 파일 전체를 메모리에 올리지 않고 스트리밍,
+    없으면 전체 로드 후 같은 항목을 순회
+    """
+    if IJSON_AVAILABLE:
+        opener = gzip.open if str(path).endswith(".gz") else open
+        with opener(path, "rb") as f:
+            yield from ijson.items(f, prefix, use_float=True)
+        return
+
+    node = load_json(path)
+    for key in prefix.split(".")[:-1]:
+        if not isinstance(node, dict):
+            return
+        node = node.get(key, [])
+    if isinstance(node, list):
+        yield from node
+
+
+def gzip_path(path: Path) -> Path:
+    """산출물 경로의 gzip 버전 (xxx.json → xxx.json.gz)"""
+    path = Path(path)
+    return path.with_name(path.name + ".gz")
+
+
+def dump_artifact(data: Any, path: Path, pretty: bool = False) -> Path:
+    """다음 스테이지만 읽는 산출물 저장
+
+    기본은 압축 JSON + gzip(xxx.json.gz), pretty=True면 들여쓴 xxx.json (디버깅용)
+    실제로 저장한 경로를 반환
+    """
+    target = Path(path) if pretty else gzip_path(path)
+    dump_json(data, target, indent=pretty)
+    return target
+
+
+def find_artifact(path: Path) -> Optional[Path]:
+    """xxx.json / xxx.json.gz 중 존재하는 최신 파일 (없으면 None)"""
+    candidates = [p for p in (Path(path), gzip_path(path)) if p.exists()]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda p: p.stat().st_mtime)
@@ -0,0 +1,65 @@
+"""collector.py 파싱 테스트"""
+
+import http.server
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import collector
+
+XHTML_PAGE = """<?xml version="1.0" encoding="utf-8"?>
+<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Strict//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-strict.dtd">
+<html xmlns="http://www.w3.org/1999/xhtml">
+<body><div class="content"><p>강남구 무료 셔틀 운행 07:30~09:30 10분</p></div></body>
+</html>""".encode("utf-8")
+
+
+def test_parse_xhtml_with_encoding_declaration():
+    tree = collector.parse_html(XHTML_PAGE)
+    assert tree is not None
+
+    districts = collector.extract_district_info(tree, "http://example.com")
+    assert [d["district"] for d in districts] == ["강남구"]
+    assert districts[0]["routes"][0]["hours"] == "07:30~09:30"
+
+
+def test_parse_html_skips_unparseable_document():
+    # 인코딩 선언이 있는 문자열은 lxml이 거부하므로 예외 대신 None
+    assert collector.parse_html(XHTML_PAGE.decode("utf-8")) is None
+
+
+def test_collect_all_sources_survives_xhtml_page(monkeypatch):
+    pages = {
+        "/xhtml": XHTML_PAGE,
+        "/html": "<html><body><p>관악구 셔틀 노선</p></body></html>".encode("utf-8"),
+    }
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = pages[self.path]
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    monkeypatch.setattr(collector, "SOURCES", [
+        {"name": "xhtml", "url": f"{base_url}/xhtml", "type": "official"},
+        {"name": "html", "url": f"{base_url}/html", "type": "official"},
+    ])
+
+    try:
+        data = collector.collect_all_sources()
+    finally:
+        server.shutdown()
+
+    assert [s["name"] for s in data["sources"]] == ["xhtml", "html"]
+    assert [d["district"] for d in data["districts"]] == ["강남구", "관악구"]
@@ -0,0 +1,23 @@
+"""agents/geocoder.py 폴백 좌표 테스트"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from agents.geocoder import GeocodingService, _LANDMARKS, _DISTRICT_CENTERS
+
+
+def test_fallback_prefers_landmark_defined_first():
+    service = GeocodingService()
+
+    # 서울역이 문자열 앞에 있어도 정의 순서가 앞선 강남역 우선
+    assert service.geocode_fallback("서울 강남") == _LANDMARKS["강남역"]
+    assert service.geocode_fallback("잠실 신촌 서울") == _LANDMARKS["서울역"]
+
+
+def test_fallback_strips_only_trailing_station_suffix():
+    service = GeocodingService()
+
+    # '역삼역'은 '삼'이 아니라 '역삼'으로 매칭
+    assert service.geocode_fallback("삼성") == _LANDMARKS["삼성역"]
+    assert service.geocode_fallback("삼거리", "강남구") == _DISTRICT_CENTERS["강남구"]